@@ -0,0 +1,188 @@
+##
+#  This module constructs the WalkForward class
+##
+
+##
+#  Imports libraries needed
+#
+import copy
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from model_matrix import ModelMatrix
+
+##
+# This class runs walk-forward backtests over the weekly panel returned by
+# DataLoader.Data(), using t as the time axis. Each fold fits a copy of a
+# pluggable model on the weeks up to its forecast origin and forecasts the
+# target horizon weeks ahead. Folds run in a process pool whose workers map
+# the panel from one shared memory-mapped matrix.
+#
+class WalkForward:
+
+    ##
+    #  @param data     dataframe returned by DataLoader.Data()
+    #  @param target   column forecast
+    #  @param features columns known at the forecast origin, the target when None
+    #  @param horizon  weeks between the forecast origin and the forecast week
+    #  @param minTrain weeks of the first training set
+    #  @param window   weeks of each training set for rolling folds, None
+    #                  for expanding folds
+    #  @param step     weeks between consecutive forecast origins
+    #
+    def __init__(self, data, target = "Salmon_NOK_kg_FP_Weekly", features = None, horizon = 1,
+                 minTrain = 104, window = None, step = 1):
+
+        self.data     = data.sort_values("t").reset_index(drop = True)
+        self.target   = target
+        self.features = list(features) if features is not None else [target]
+        self.horizon  = horizon
+        self.minTrain = minTrain
+        self.window   = window
+        self.step     = step
+
+    ##
+    #  Forecast origins and training ranges
+    #  @return dataframe with fold, trainStart, origin and forecast row positions
+    #
+    def Folds(self):
+
+        _origins = np.arange(self.minTrain - 1, len(self.data) - self.horizon, self.step)
+        _starts  = np.zeros(len(_origins), dtype = "int64") if self.window is None \
+                   else np.maximum(_origins - self.window + 1, 0)
+
+        return pd.DataFrame({"fold"      : np.arange(len(_origins)),
+                             "trainStart": _starts,
+                             "origin"    : _origins,
+                             "forecast"  : _origins + self.horizon})
+
+    ##
+    #  Fits the model on every fold and collects the forecasts
+    #  @param model    object with fit(X, y) and predict(X), copied per fold,
+    #                  LeastSquares when None
+    #  @param parallel runs the folds in a process pool
+    #  @param workers  number of worker processes, one per CPU when None
+    #  @param chunks   number of fold batches per worker
+    #  @return dataframe with the origin t, forecast t, forecast, actual and
+    #          error of each fold
+    #
+    def Run(self, model = None, parallel = True, workers = None, chunks = 4):
+
+        _model   = model if model is not None else LeastSquares()
+        _folds   = self.Folds()
+        _columns = list(dict.fromkeys(self.features + [self.target]))
+        _target  = _columns.index(self.target)
+
+        if not parallel:
+            _matrix = self.data[_columns].to_numpy("float64", na_value = np.nan)
+            _parts  = [_runFolds(_folds.to_numpy(), _model, self.horizon, len(self.features), _target, _matrix)]
+        else:
+            _workers = workers or os.cpu_count() or 1
+            _batches = np.array_split(_folds.to_numpy(), max(1, min(len(_folds), _workers * chunks)))
+
+            with tempfile.TemporaryDirectory(prefix = "laks_backtest_") as _dir:
+                _path = os.path.join(_dir, "panel")
+                ModelMatrix.Export(self.data[_columns], _path)
+
+                with ProcessPoolExecutor(max_workers = _workers, initializer = _initWorker,
+                                         initargs = (_path,)) as _pool:
+                    _parts = list(_pool.map(_runFolds, _batches, [_model] * len(_batches),
+                                            [self.horizon] * len(_batches), [len(self.features)] * len(_batches),
+                                            [_target] * len(_batches)))
+
+        results = pd.DataFrame(np.concatenate(_parts), columns = ["fold", "origin", "forecastRow", "forecast"])
+        results = results.astype({"fold": "int64", "origin": "int64", "forecastRow": "int64"})
+
+        ## Row positions back to the t of the panel
+        _t                = self.data["t"].to_numpy()
+        _rows             = results["forecastRow"].to_numpy()
+        results["origin"] = _t[results["origin"].to_numpy()]
+        results["t"]      = _t[_rows]
+        results["actual"] = self.data[self.target].to_numpy("float64", na_value = np.nan)[_rows]
+        results["error"]  = results["forecast"] - results["actual"]
+
+        return results.drop(columns = "forecastRow")
+
+    ##
+    #  Error metrics of a backtest
+    #  @param results dataframe returned by Run()
+    #  @return dictionary with the number of forecasts, MAE, RMSE, MAPE (%) and bias
+    #
+    @staticmethod
+    def Metrics(results):
+
+        _valid = results.dropna(subset = ["error"])
+        _error = _valid["error"].to_numpy()
+
+        return {"forecasts": len(_valid),
+                "MAE"      : float(np.mean(np.abs(_error))) if len(_error) else np.nan,
+                "RMSE"     : float(np.sqrt(np.mean(_error ** 2))) if len(_error) else np.nan,
+                "MAPE"     : float(np.mean(np.abs(_error / _valid["actual"].to_numpy())) * 100) if len(_error) else np.nan,
+                "bias"     : float(np.mean(_error)) if len(_error) else np.nan}
+
+
+##
+# Linear least squares with intercept, the default backtest model
+#
+class LeastSquares:
+
+    def fit(self, X, y):
+
+        self.coef_ = np.linalg.lstsq(np.column_stack([np.ones(len(X)), X]), y, rcond = None)[0]
+
+        return self
+
+    def predict(self, X):
+
+        return np.column_stack([np.ones(len(X)), X]) @ self.coef_
+
+
+## Feature and target matrix mapped by each worker process, exported in
+## column order so that the folds slice views of the map without copying it
+_WORKER_MATRIX = None
+
+
+def _initWorker(path):
+
+    global _WORKER_MATRIX
+
+    _WORKER_MATRIX = ModelMatrix.Load(path).matrix
+
+
+##
+#  Fits and forecasts a batch of folds
+#  @param folds    array of (fold, trainStart, origin, forecast) rows
+#  @param model    model copied for each fold
+#  @param horizon  weeks between origin and forecast
+#  @param features number of feature columns, the first columns of matrix
+#  @param target   column of the target, after the features or among them
+#  @param matrix   feature and target matrix, the worker's mapped one when None
+#  @return array of (fold, origin, forecast row, forecast) rows
+#
+def _runFolds(folds, model, horizon, features, target, matrix = None):
+
+    _matrix = _WORKER_MATRIX if matrix is None else matrix
+    _X      = _matrix[:, :features]
+    _y      = _matrix[:, target]
+    _out    = np.full((len(folds), 4), np.nan)
+
+    for i, (_fold, _start, _origin, _forecast) in enumerate(folds):
+        _out[i, :3] = (_fold, _origin, _forecast)
+
+        ## Features at week s explain the target at week s + horizon, known by the origin
+        _XTrain = _X[_start:_origin - horizon + 1]
+        _yTrain = _y[_start + horizon:_origin + 1]
+        _valid  = ~(np.isnan(_XTrain).any(axis = 1) | np.isnan(_yTrain))
+        _XTest  = _X[_origin:_origin + 1]
+
+        if _valid.sum() <= features or np.isnan(_XTest).any():
+            continue
+
+        _model     = copy.deepcopy(model).fit(_XTrain[_valid], _yTrain[_valid])
+        _out[i, 3] = _model.predict(_XTest)[0]
+
+    return _out
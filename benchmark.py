@@ -0,0 +1,776 @@
+##
+#  This module constructs the Benchmark class
+##
+
+##
+#  Imports libraries needed
+#
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DataLoader
+from iso_calendar import IsoCalendar
+from scenario_engine import ScenarioEngine
+from ssb_table import SsbTable
+from temporal_disaggregation import TemporalDisaggregation
+
+##
+# This class times the DataLoader ingestion paths, on the shipped files and
+# on synthetic workbooks, so changes to the loaders can be compared.
+#
+class Benchmark:
+
+    ## Rows above and below the records of each scaled worksheet
+    SYNTHETIC_ROWS = {
+        "SALMON_EXPORTS"       : ("Sheet1", 1, 0),
+        "SALMON_BIOMASS"       : ("Biomasse-flk", 6, 0),
+        "SALMON_ESCAPES"       : ("Sheet 1", 1, 0),
+        "CPI_NORWAY"           : ("Sheet1", 1, 2),
+        "PROTEIN_CPI_MEAT"     : ("Sheet1", 1, 0)
+    }
+
+    def __init__(self, repeat = 3, workDir = None):
+
+        self.repeat  = repeat
+        self.workDir = workDir or tempfile.mkdtemp(prefix = "laks_benchmark_")
+
+    ##
+    #  Times a callable
+    #  @param name label of the measurement
+    #  @param func callable without arguments
+    #  @return dictionary with the best and mean wall time in seconds
+    #
+    def Time(self, name, func):
+
+        _times = []
+
+        for _ in range(self.repeat):
+            _start = time.perf_counter()
+            func()
+            _times.append(time.perf_counter() - _start)
+
+        return {"name": name, "best_s": min(_times), "mean_s": float(np.mean(_times))}
+
+    ##
+    #  Peak traced memory of a callable, run once apart from the timings
+    #  @param func callable without arguments
+    #  @return tuple (result of func, peak memory in MB)
+    #
+    def Memory(self, func):
+
+        tracemalloc.start()
+
+        try:
+            _result = func()
+            _peak   = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        return _result, _peak / 1024 ** 2
+
+    ##
+    #  Times every public loader and Data() end-to-end. peak_mb is traced by
+    #  tracemalloc, which only sees Python allocations: the memory of the
+    #  native python-calamine parser is not counted in it
+    #  @param loader DataLoader to measure, the shipped files without cache when None
+    #  @return dataframe with rows out, wall time and peak memory per loader
+    #
+    def Loaders(self, loader = None):
+
+        _loader = loader or DataLoader(cacheDir = None)
+        _rows   = []
+
+        for _name in list(_loader.SOURCE_FILES) + ["Data"]:
+            _func        = getattr(_loader, _name)
+            _data, _peak = self.Memory(_func)
+            _time        = self.Time(_name, _func)
+
+            _rows.append(dict(_time, rows = len(_data), peak_mb = _peak))
+
+        return pd.DataFrame(_rows)
+
+    ##
+    #  Writes synthetic workbooks holding each record of the shipped files
+    #  scale times and points a loader at them. The Bloomberg-style files
+    #  repeat every daily row, which keeps the weekly result unchanged. The
+    #  Fish Pool and SSB prices stay at their shipped size since their weeks
+    #  must be unique for Data() to merge them
+    #  @param scale number of copies of each record
+    #  @return DataLoader reading the synthetic files, without cache
+    #
+    def Synthetic(self, scale):
+
+        _loader = DataLoader(cacheDir = None)
+        _dir    = os.path.join(self.workDir, f"scale_{scale}")
+
+        os.makedirs(_dir, exist_ok = True)
+
+        for _name, _attr in _loader.SOURCE_FILES.items():
+            _source   = getattr(_loader, _attr)
+            _fileName = os.path.join(_dir, os.path.basename(_source))
+
+            if _attr in ("SALMON_PRICE_FISHPOOL", "SALMON_PRICE_SSB"):
+                shutil.copyfile(_source, _fileName)
+            elif not os.path.exists(_fileName):
+                _sheet, _top, _bottom = self.SYNTHETIC_ROWS.get(_attr, ("Sheet1", 1, 0))
+                _sheets = pd.read_excel(_source, sheet_name = None, header = None)
+
+                with pd.ExcelWriter(_fileName) as _writer:
+                    for _sheetName, _grid in _sheets.items():
+                        if _sheetName == _sheet:
+                            _end  = len(_grid) - _bottom
+                            _grid = pd.concat([_grid.iloc[:_top]] + [_grid.iloc[_top:_end]] * scale
+                                              + [_grid.iloc[_end:]], ignore_index = True)
+                        _grid.to_excel(_writer, sheet_name = _sheetName, header = False, index = False)
+
+            setattr(_loader, _attr, _fileName)
+
+        return _loader
+
+    ##
+    #  Times the loaders on synthetic files of growing size
+    #  @param scales multiples of the shipped files
+    #  @return dataframe with the Loaders() measurements per scale
+    #
+    def Scaling(self, scales = (1, 10, 100)):
+
+        return pd.concat([self.Loaders(self.Synthetic(_scale)).assign(scale = _scale)
+                          for _scale in scales], ignore_index = True)
+
+    ##
+    #  Compares the Excel engines on every shipped file, reading all sheets,
+    #  and checks that each engine returns the frames of pandas' default
+    #  @param engines engines compared with the default one, the installed
+    #                 ones among calamine when None
+    #  @return dataframe with the best read time per file and engine
+    #
+    def Engines(self, engines = None):
+
+        _engines = engines if engines is not None else (["calamine"] if DataLoader.CALAMINE else [])
+        _rows    = []
+
+        for _name, _attr in DataLoader.SOURCE_FILES.items():
+            _fileName = getattr(DataLoader, _attr)
+            _default  = pd.read_excel(_fileName, sheet_name = None, header = None)
+            _row      = {"source" : _name,
+                         "file"   : os.path.basename(_fileName),
+                         "default": self.Time("default", lambda: pd.read_excel(_fileName, sheet_name = None,
+                                                                                header = None))["best_s"]}
+
+            for _engine in _engines:
+                _sheets = pd.read_excel(_fileName, sheet_name = None, header = None, engine = _engine)
+
+                assert _sheets.keys() == _default.keys()
+                assert all(_sheets[key].equals(_default[key]) for key in _sheets)
+
+                _row[_engine] = self.Time(_engine, lambda: pd.read_excel(_fileName, sheet_name = None, header = None,
+                                                                          engine = _engine))["best_s"]
+                _row[f"{_engine}_speedup"] = _row["default"] / _row[_engine]
+
+            _rows.append(_row)
+
+        return pd.DataFrame(_rows)
+
+    ##
+    #  Compares the single-pass Fish Pool read against re-parsing the
+    #  workbook once per year sheet, as the number of sheets grows. Both
+    #  read with pandas' default engine, so that only the single pass is timed
+    #  @param sheetCounts numbers of yearly sheets of the synthetic workbooks
+    #  @return dataframe with the timings per sheet count
+    #
+    def FishPoolSheets(self, sheetCounts = (5, 10, 20, 40)):
+
+        _template = pd.read_excel(DataLoader.SALMON_PRICE_FISHPOOL, sheet_name = 0, header = None)
+        _rows     = []
+
+        for _count in sheetCounts:
+            _fileName = os.path.join(self.workDir, f"Price_FishPool_{_count}.xlsx")
+
+            with pd.ExcelWriter(_fileName) as _writer:
+                for _sheet in range(_count):
+                    _template.to_excel(_writer, sheet_name = str(2000 + _sheet), header = False, index = False)
+
+            _loader = DataLoader(cacheDir = None, engine = None)
+            _loader.SALMON_PRICE_FISHPOOL = _fileName
+
+            _single  = self.Time("single_pass", _loader.SalmonPriceFishPool)
+            _reparse = self.Time("per_sheet", lambda: self._fishPoolPerSheet(_fileName))
+
+            _rows.append({"sheets"     : _count,
+                          "per_sheet_s": _reparse["best_s"],
+                          "single_s"   : _single["best_s"],
+                          "speedup"    : _reparse["best_s"] / _single["best_s"]})
+
+        return pd.DataFrame(_rows)
+
+    ##
+    #  Checks that the single-concatenation merge returns the panel of the
+    #  previous sequential merges bit for bit, then times both, on the
+    #  shipped sources and on the sources repeated as extra columns
+    #  @param copies numbers of copies of every non Fish Pool source
+    #  @return dataframe with the timings per number of copies
+    #
+    def Merge(self, copies = (1, 4)):
+
+        _loader  = DataLoader()
+        _sources = _loader._loadSources(_loader.SOURCE_FILES)
+
+        pd.testing.assert_frame_equal(_loader._merge(_sources), self._sequentialMerge(_sources), check_exact = True)
+
+        _rows = []
+
+        for _count in copies:
+            _wide = {name: (data if name == "SalmonPriceFishPool" or _count == 1 else
+                            pd.concat([data] + [data.drop(columns = ["Year", "Week", "Month"], errors = "ignore")
+                                                .add_suffix(f"_Copy{i}") for i in range(1, _count)], axis = 1))
+                     for name, data in _sources.items()}
+
+            _merged = self.Time("merge", lambda: _loader._merge(_wide))
+            _before = self.Time("sequential", lambda: self._sequentialMerge(_wide))
+
+            _rows.append({"copies"      : _count,
+                          "sequential_s": _before["best_s"],
+                          "merge_s"     : _merged["best_s"],
+                          "speedup"     : _before["best_s"] / _merged["best_s"]})
+
+        return pd.DataFrame(_rows)
+
+    ##
+    #  Checks the numeric ISO week conversion and the shared weekly calendar
+    #  against pandas and the string round-trip for every day from 2000 to
+    #  2030, then times both conversions on a large frame
+    #  @param rows number of (year, week) pairs of the timed frame
+    #  @return dataframe with the timings of both conversions
+    #
+    def IsoWeeks(self, rows = 1_000_000):
+
+        _days        = pd.Series(pd.date_range("2000-01-01", "2030-12-31", freq = "D"))
+        _iso         = _days.dt.isocalendar()
+        _year, _week  = IsoCalendar.DateToWeek(_days)
+
+        assert np.array_equal(_year, _iso["year"].to_numpy("int64"))
+        assert np.array_equal(_week, _iso["week"].to_numpy("int64"))
+        assert np.array_equal(IsoCalendar.Month(_days), _days.dt.month.to_numpy("int64"))
+
+        _calendar  = IsoCalendar.Weekly()
+        _positions = _calendar.Position(_days)
+
+        assert np.array_equal(_calendar.year[_positions], _iso["year"].to_numpy("int64"))
+        assert np.array_equal(_calendar.week[_positions], _iso["week"].to_numpy("int64"))
+        assert _calendar.period[_positions].equals(pd.PeriodIndex(_days.dt.to_period("W")))
+
+        _mondays = _days[_days.dt.dayofweek == 0].reset_index(drop = True)
+        _iso     = _mondays.dt.isocalendar()
+
+        assert np.array_equal(IsoCalendar.WeekToDate(_iso["year"], _iso["week"]),
+                              self._isoWeekString(_iso["year"], _iso["week"]).to_numpy("datetime64[ns]"))
+
+        _sample = _iso.sample(rows, replace = True, random_state = 0)
+        _string = self.Time("string", lambda: self._isoWeekString(_sample["year"], _sample["week"]))
+        _numpy  = self.Time("numpy", lambda: IsoCalendar.WeekToDate(_sample["year"], _sample["week"]))
+
+        return pd.DataFrame([_string, _numpy]).assign(speedup = lambda df: _string["best_s"] / df["best_s"])
+
+    ##
+    #  Checks the weekly last-observation kernel for exact equality with
+    #  resample("W-MON").last() on every shipped Bloomberg-style file and on
+    #  unsorted synthetic series with gaps, then times both on the latter
+    #  @param rows   number of daily rows of the synthetic series
+    #  @param series number of series sharing the synthetic dates
+    #  @return dataframe with the timings of both paths per row order
+    #
+    def WeeklyLast(self, rows = 1_000_000, series = 8):
+
+        _calendar = IsoCalendar.Weekly()
+
+        for _name, _attr in DataLoader.SOURCE_FILES.items():
+            _data = pd.read_excel(getattr(DataLoader, _attr), header = 0)
+
+            if list(_data.columns) != ["Date", "Last Price"]:
+                continue
+
+            _positions, _weekly = DataLoader._weeklyLast(_data["Date"], _data[["Last Price"]].to_numpy("float64"))
+            _old                = self._weeklyResample(_data)
+
+            assert np.array_equal(_calendar.dates[_positions], _old.index.to_numpy("datetime64[ns]"))
+            assert np.array_equal(_weekly, _old.to_numpy(), equal_nan = True)
+
+        _rng    = np.random.default_rng(0)
+        _dates  = np.datetime64("2000-01-03") + _rng.integers(0, 365 * 25, rows).astype("timedelta64[D]")
+        _values = _rng.normal(size = (rows, series))
+        _values[_rng.random((rows, series)) < 0.2] = np.nan
+        _data   = pd.DataFrame(_values, columns = [f"s{i}" for i in range(series)]).assign(Date = _dates)
+
+        _positions, _weekly = DataLoader._weeklyLast(_data["Date"], _values)
+        _old                = self._weeklyResample(_data)
+
+        assert np.array_equal(_calendar.dates[_positions], _old.index.to_numpy("datetime64[ns]"))
+        assert np.array_equal(_weekly, _old.to_numpy(), equal_nan = True)
+
+        ## Unsorted, ascending and descending rows
+        _timings = []
+
+        for _order, _rows in [("unsorted", _data),
+                              ("ascending", _data.sort_values("Date", kind = "stable")),
+                              ("descending", _data.sort_values("Date", kind = "stable").iloc[::-1])]:
+            _matrix   = _rows.drop(columns = "Date").to_numpy()
+            _resample = self.Time("resample", lambda: self._weeklyResample(_rows))
+            _kernel   = self.Time("searchsorted", lambda: DataLoader._weeklyLast(_rows["Date"], _matrix))
+
+            _timings.append({"order"         : _order,
+                             "resample_s"    : _resample["best_s"],
+                             "searchsorted_s": _kernel["best_s"],
+                             "speedup"       : _resample["best_s"] / _kernel["best_s"]})
+
+        return pd.DataFrame(_timings).assign(rows = rows, series = series)
+
+    ##
+    #  Compares the batch load of the Bloomberg-style files against one
+    #  _loadWeekly run per file, checking every column of the wide frame
+    #  against its loader
+    #  @return dataframe with the timings of both paths
+    #
+    def WeeklyBatch(self):
+
+        _loader = DataLoader(cacheDir = None)
+        _wide   = _loader.WeeklyBatch()
+
+        for _name in _loader.BLOOMBERG_SOURCES:
+            _single = getattr(_loader, _name)()
+            _column = _loader.SOURCE_COLUMNS[_name][0]
+            _merged = _single.merge(_wide[["Year", "Week", "Month", _column]], on = ["Year", "Week", "Month"],
+                                    how = "left", suffixes = ("", "_batch"))
+
+            assert np.array_equal(_merged[_column], _merged[_column + "_batch"], equal_nan = True)
+            assert _wide[_column].count() == _single[_column].count()
+
+        _perFile = self.Time("per_file", lambda: [getattr(_loader, _name)() for _name in _loader.BLOOMBERG_SOURCES])
+        _batch   = self.Time("batch", _loader.WeeklyBatch)
+
+        return (pd.DataFrame([_perFile, _batch])
+                .assign(files = len(_loader.BLOOMBERG_SOURCES), speedup = lambda df: _perFile["best_s"] / df["best_s"]))
+
+    ##
+    #  Compares ValidateData() against the previous pandas passes on the
+    #  panel widened to a number of columns, checking that both find the
+    #  same monthly uniques, missing shares and summary statistics
+    #  @param columns number of columns of the widened panel
+    #  @return dataframe with the timings of both validations
+    #
+    def Validation(self, columns = 2000):
+
+        _loader = DataLoader()
+        _data   = _loader.Data()
+        _values = _data.columns.drop(["t", "Date", "Year", "Week", "Month"])
+        _copies = max(1, columns // len(_values))
+        _wide   = pd.concat([_data[["t", "Date", "Year", "Week", "Month"]]]
+                            + [_data[_values].add_suffix(f"_{i}") for i in range(_copies)], axis = 1)
+
+        ## Monthly column names keep "_Monthly" inside them
+        _wide.columns = [col.replace("_Monthly_", "_Monthly_Copy") for col in _wide.columns]
+
+        _report                     = _loader.ValidateData(_wide, verbose = False)
+        _unique, _missing, _summary = self._validatePandas(_wide)
+
+        assert _report.passed
+        assert _report.Frame().set_index("check").loc["monthly merge consistency", "value"] \
+               == f"max {_unique} unique values per month"
+        assert np.allclose(_report.details["missing values"].sort_index(), _missing[_missing > 0].sort_index())
+        assert np.allclose(_report.details["numeric summary"].to_numpy(), _summary.to_numpy("float64"), rtol = 1e-9,
+                           equal_nan = True)
+
+        _pandas = self.Time("pandas", lambda: self._validatePandas(_wide))
+        _numpy  = self.Time("single_pass", lambda: _loader.ValidateData(_wide, verbose = False))
+
+        return (pd.DataFrame([_pandas, _numpy])
+                .assign(columns = len(_wide.columns), speedup = lambda df: _pandas["best_s"] / df["best_s"]))
+
+    ##
+    #  Compares the SSB table reader against the previous per-cell string
+    #  building and slicing, on century-long wide monthly tables and on a
+    #  long column of weekly codes, checking that both agree
+    #  @param tables number of year x month tables
+    #  @param years  years per table, ending in 2025
+    #  @param weeks  number of "YYYYUww" codes
+    #  @return dataframe with the timings per layout
+    #
+    def SsbTables(self, tables = 100, years = 100, weeks = 1_000_000):
+
+        _rng    = np.random.default_rng(0)
+        _years  = np.arange(2025 - years + 1, 2026)
+        _tables = [pd.DataFrame(_rng.normal(100, 10, (years, 12)), columns = [f"{m:02d}" for m in range(1, 13)])
+                   .assign(Year = _years) for _ in range(tables)]
+
+        _table  = _tables[0]
+        _old    = self._yearMonthStrings(_table)
+        _new    = SsbTable.YearMonth(_table["Year"], _table.drop(columns = "Year"), "Value")
+
+        assert _old.equals(_new)
+
+        _positions   = _rng.integers(0, len(IsoCalendar.Weekly()), weeks)
+        _calendar    = IsoCalendar.Weekly()
+        _codes       = pd.Series([f"{y}U{w:02d}" for y, w in
+                                  zip(_calendar.year[_positions], _calendar.week[_positions])])
+        _year, _week = SsbTable.Codes(_codes, SsbTable.WEEK)
+
+        assert np.array_equal(_year, _codes.str[:4].astype(int)) and np.array_equal(_week, _codes.str[5:].astype(int))
+
+        _rows = []
+
+        for _layout, _before, _after in [
+                ("year_month", lambda: [self._yearMonthStrings(t) for t in _tables],
+                               lambda: [SsbTable.YearMonth(t["Year"], t.drop(columns = "Year"), "Value") for t in _tables]),
+                ("week_codes", lambda: (_codes.astype(str).str[:4].astype(int), _codes.astype(str).str[5:].astype(int)),
+                               lambda: SsbTable.Codes(_codes, SsbTable.WEEK))]:
+            _strings = self.Time("strings", _before)["best_s"]
+            _arrays  = self.Time("arrays", _after)["best_s"]
+
+            _rows.append({"layout": _layout, "strings_s": _strings, "arrays_s": _arrays, "speedup": _strings / _arrays})
+
+        return pd.DataFrame(_rows)
+
+    ##
+    #  Times the Denton disaggregation of the panel's monthly columns, widened
+    #  with synthetic monthly series: a cold solve, a solve reusing the
+    #  memoized weights, and the tail update after the last months of the
+    #  panel arrive, checking that the weeks aggregate to each month and
+    #  that the tail update matches a full solve
+    #  @param series number of synthetic monthly series added
+    #  @param months months removed before the tail update
+    #  @return dataframe with the timing of each run
+    #
+    def Disaggregation(self, series = 200, months = 2):
+
+        _data    = DataLoader(cacheDir = None).Data()
+        _monthly = list(_data.columns[_data.columns.str.contains("_Monthly")])
+        _codes   = _data["Date"].dt.start_time.dt.year.to_numpy() * 12 + _data["Month"].to_numpy()
+        _rng     = np.random.default_rng(0)
+        _values  = np.cumsum(_rng.normal(0, 1, (_codes.max() - _codes.min() + 1, series)), axis = 0) + 100
+        _data    = pd.concat([_data, pd.DataFrame(_values[_codes - _codes.min()], index = _data.index,
+                                                  columns = [f"Synthetic_{i}_Monthly" for i in range(series)])], axis = 1)
+        _columns = _monthly + [f"Synthetic_{i}_Monthly" for i in range(series)]
+        _flows   = DataLoader.MONTHLY_FLOWS
+        _head    = _data[_codes < np.unique(_codes)[-months]]
+
+        _full = TemporalDisaggregation().Panel(_data, _columns, _flows)
+        _weeks = pd.DataFrame(_full[_columns].to_numpy(), columns = _columns).groupby(_codes)
+        _month = np.where(np.isin(_columns, _flows), _weeks.sum(min_count = 1), _weeks.mean())
+
+        ## Months fully inside the panel average, or sum, to the ISO-year aligned value
+        _aligned = _data["Year"].to_numpy() == _data["Date"].dt.start_time.dt.year.to_numpy()
+        _target  = _data[_aligned].groupby(_codes[_aligned])[_columns].first()
+        _result  = pd.DataFrame(_month, index = np.unique(_codes), columns = _columns).loc[_target.index]
+
+        assert np.allclose(_result.iloc[1:-1], _target.iloc[1:-1], rtol = 1e-8, equal_nan = True)
+
+        _tail = TemporalDisaggregation()
+        _tail.Panel(_head, _columns, _flows)
+
+        assert np.allclose(_tail.Panel(_data, _columns, _flows)[_columns], _full[_columns], rtol = 1e-8, atol = 1e-6,
+                           equal_nan = True)
+
+        _state = _tail._last
+        _warm  = TemporalDisaggregation()
+        _warm.Panel(_data, _columns, _flows)
+
+        ## The previous panel is reset before each run, the memoized weights are kept
+        def _solve(disaggregation, state):
+            disaggregation._last = state
+            return disaggregation.Panel(_data, _columns, _flows)
+
+        _rows = []
+
+        for _run, _func in [("cold", lambda: TemporalDisaggregation().Panel(_data, _columns, _flows)),
+                            ("memoized weights", lambda: _solve(_warm, None)),
+                            ("tail update", lambda: _solve(_tail, _state))]:
+            _rows.append(self.Time(_run, _func))
+
+        return pd.DataFrame(_rows)
+
+    ##
+    #  Compares regional range queries on the biomass cube against pandas
+    #  filters and sums on the county frame, checking that both agree
+    #  @param queries number of random county, month range and measure queries
+    #  @return dataframe with the timings of both query paths
+    #
+    def BiomassCube(self, queries = 1000):
+
+        _loader   = DataLoader()
+        _data     = _loader.SalmonBiomassCounty()
+        _cube     = _loader.BiomassCube()
+        _rng      = np.random.default_rng(0)
+        _months   = np.sort(_rng.integers(0, len(_cube.year), (queries, 2)), axis = 1)
+        _queries  = [(_cube.counties[c], (_cube.year[a], _cube.month[a]), (_cube.year[b], _cube.month[b]),
+                      _cube.measures[m])
+                     for c, (a, b), m in zip(_rng.integers(0, len(_cube.counties), queries), _months,
+                                             _rng.integers(0, len(_cube.measures), queries))]
+        _codes    = _data["Year"] * 12 + _data["Month"]
+
+        def _pandas(county, start, end, measure):
+            _rows = (_data["County"] == county) & _codes.between(start[0] * 12 + start[1], end[0] * 12 + end[1])
+            return _data.loc[_rows, measure].sum()
+
+        assert np.allclose([_pandas(*q) for q in _queries], [_cube.Total(*q) for q in _queries])
+        assert np.allclose(_cube.national, _loader.SalmonBiomass().set_index(["Year", "Month"])
+                           .reindex(pd.MultiIndex.from_arrays([_cube.year, _cube.month]), fill_value = 0))
+
+        _rows = [self.Time("pandas", lambda: [_pandas(*q) for q in _queries]),
+                 self.Time("cube", lambda: [_cube.Total(*q) for q in _queries])]
+
+        return pd.DataFrame(_rows).assign(queries = queries, speedup = lambda df: _rows[0]["best_s"] / df["best_s"])
+
+    ##
+    #  Compares the broadcast scenario revaluation against a loop over the
+    #  scenarios, on constant shocks and on weekly shock paths, checking
+    #  that both agree
+    #  @param scenarios number of random scenarios
+    #  @param paths     number of random weekly shock paths
+    #  @return dataframe with the timings per shock layout
+    #
+    def Scenarios(self, scenarios = 10_000, paths = 1000):
+
+        _engine = ScenarioEngine(DataLoader().Data())
+        _rng    = np.random.default_rng(0)
+        _rows   = []
+
+        for _layout, _shocks in [("constant", _rng.normal(0, 0.1, (scenarios, 3))),
+                                 ("paths", _rng.normal(0, 0.05, (paths, len(_engine.base), 3)))]:
+            _loop      = lambda: self._revalueLoop(_engine, _shocks)
+            _broadcast = lambda: _engine.Revalue(_shocks, total = True)
+
+            _revenues = _broadcast()
+
+            assert all(np.allclose(_revenues[c], _total) for c, _total in zip(_engine.CURRENCIES, _loop()))
+
+            _before = self.Time("loop", _loop)["best_s"]
+            _after  = self.Time("broadcast", _broadcast)["best_s"]
+
+            _rows.append({"layout": _layout, "scenarios": len(_shocks), "loop_s": _before, "broadcast_s": _after,
+                          "speedup": _before / _after})
+
+        return pd.DataFrame(_rows)
+
+    ##
+    #  Compares the weekly escape aggregation through integer week codes
+    #  against the previous string patching and resample, on a synthetic
+    #  register repeating every shipped event scale times
+    #  @param scale number of copies of each escape event
+    #  @return dataframe with the timings of both aggregations
+    #
+    def Escapes(self, scale = 100):
+
+        _loader = DataLoader(cacheDir = None)
+        _data   = pd.read_excel(_loader.SALMON_ESCAPES)
+        _data   = _data[_data["Art"] == "Laks"]
+        _events = pd.DataFrame({
+                  "Date"                       : pd.to_datetime(_data["Dato"], format = "%m/%d/%Y"),
+                  "Salmon_Escapes_Rep_Escaped" : _data["Rapportert rømt"],
+                  "Salmon_Escapes_Avg_Wt_Grams": _data["Snittvekt (gram)"],
+                  "Salmon_Escapes_Recapture"   : _data["Gjenfangst"]
+                  })
+        _events = pd.concat([_events] * scale, ignore_index = True)
+
+        _weekly = DataLoader._escapesWeekly(_events)
+        _old    = self._escapesResample(_events)
+
+        assert np.allclose(_weekly.iloc[:, 3:].to_numpy(), _old.to_numpy(), rtol = 1e-12, equal_nan = True)
+
+        _resample = self.Time("resample", lambda: self._escapesResample(_events))
+        _codes    = self.Time("week_codes", lambda: DataLoader._escapesWeekly(_events))
+
+        return (pd.DataFrame([_resample, _codes])
+                .assign(events = len(_events), speedup = lambda df: _resample["best_s"] / df["best_s"]))
+
+    ##
+    #  Previous merge of Data(): one DataFrame.merge per source on the
+    #  growing panel, weekly sources by Date and monthly ones by Year/Month
+    #
+    @staticmethod
+    def _sequentialMerge(sources):
+
+        def _mondays(data):
+            return pd.to_datetime(data["Year"].astype(str) + "-W" + data["Week"].astype(str).str.zfill(2) + "-1",
+                                  format = "%G-W%V-%u")
+
+        _data = sources["SalmonPriceFishPool"].copy()
+        _data["Date"] = _mondays(_data)
+
+        calendar = pd.DataFrame({"Date": pd.date_range(start = _data["Date"].min(), end = _data["Date"].max(),
+                                                       freq = "W-MON")})
+
+        calendar["Year"]  = calendar["Date"].dt.isocalendar().year
+        calendar["Week"]  = calendar["Date"].dt.isocalendar().week
+        calendar["Month"] = calendar["Date"].dt.month
+
+        data = calendar.merge(_data.drop(columns = ["Date"], errors = "ignore"), on = ["Year", "Week", "Month"],
+                              how = "left")
+
+        for name in DataLoader.WEEKLY_SOURCES:
+            w = sources[name].copy()
+            w["Date"] = _mondays(w)
+            w = w.drop(columns = ["Year", "Week", "Month"], errors = "ignore")
+
+            data = data.merge(w, on = "Date", how = "left")
+
+        for name in DataLoader.MONTHLY_SOURCES:
+            m = sources[name].groupby(["Year", "Month"], as_index = False).first()
+
+            data = data.merge(m, on = ["Year", "Month"], how = "left", validate = "many_to_one")
+
+        data = data.sort_values("Date").reset_index(drop = True)
+
+        _fillCols = data.columns[data.columns.str.contains("Weekly|Commodity|Equity|EURNOK|USDNOK|Salmon_NOK_kg")]
+        _fillCols = _fillCols[~_fillCols.str.contains("Biomass|Escapes")]
+
+        data[_fillCols] = data[_fillCols].ffill()
+        data.insert(0, "t", range(len(data)))
+        data["Date"] = data["Date"].dt.to_period("W")
+
+        return data[data["Date"] <= pd.Period(DataLoader.CUTOFF, freq = "W")]
+
+    ##
+    #  Previous weekly conversion, sort and resample("W-MON").last()
+    #
+    @staticmethod
+    def _weeklyResample(data):
+
+        return data.sort_values("Date", kind = "stable").set_index("Date").resample("W-MON").last()
+
+    ##
+    #  Previous validation passes, without the printing
+    #
+    @staticmethod
+    def _validatePandas(data):
+
+        data.duplicated(["Year", "Week"]).sum()
+        data["Date"].duplicated().sum()
+
+        _missing = (data.isna().mean() * 100).sort_values(ascending = False)
+        _unique  = data.groupby(["Year", "Month"])[data.filter(like = "_Monthly").columns].nunique().max().max()
+        _numeric = data.select_dtypes(include = "number")
+        _summary = _numeric.describe().T
+
+        (_numeric.abs() > 1e6).sum()
+        data["Date"].diff().dropna().value_counts()
+
+        return _unique, _missing, _summary
+
+    ##
+    #  Previous year x month reshape, one date string per cell
+    #
+    @staticmethod
+    def _yearMonthStrings(table):
+
+        _months = [f"{m:02d}" for m in range(1, 13)]
+        _dates  = [f"{i}-{j}-01" for i in table["Year"].tolist() for j in _months]
+        _data   = pd.DataFrame({"Date" : pd.to_datetime(_dates, format = "%Y-%m-%d"),
+                                "Value": table[_months].to_numpy().ravel().tolist()})
+
+        return pd.DataFrame({"Year" : _data["Date"].dt.year.astype("int64"),
+                             "Month": _data["Date"].dt.month.astype("int64"),
+                             "Value": _data["Value"].astype("float64")})
+
+    ##
+    #  Total revenues per currency, one scenario at a time
+    #
+    @staticmethod
+    def _revalueLoop(engine, shocks):
+
+        _revenue, _eurnok, _usdnok = engine.base[:, [0, 2, 3]].T
+        _totals = np.zeros((3, len(shocks)))
+
+        for i, _shock in enumerate(shocks):
+            _nok = _revenue * (1.0 + _shock[..., 0])
+
+            _totals[:, i] = [np.nansum(_nok), np.nansum(_nok / (_eurnok * (1.0 + _shock[..., 1]))),
+                             np.nansum(_nok / (_usdnok * (1.0 + _shock[..., 2])))]
+
+        return _totals
+
+    ##
+    #  Previous escape aggregation, string patching and resample("W-MON")
+    #
+    @staticmethod
+    def _escapesResample(events):
+
+        _data = events.set_index("Date")
+        _data["Salmon_Escapes_Rep_Escaped"] = pd.to_numeric(
+            _data["Salmon_Escapes_Rep_Escaped"].replace("E:10 - 100", "55").astype(str).str.replace("E:", "", regex = False),
+            errors = "coerce")
+
+        return _data.resample("W-MON").agg({"Salmon_Escapes_Rep_Escaped" : "sum",
+                                            "Salmon_Escapes_Avg_Wt_Grams": "mean",
+                                            "Salmon_Escapes_Recapture"   : "sum"})
+
+    ##
+    #  Previous ISO week conversion through "YYYY-Www-1" strings
+    #
+    @staticmethod
+    def _isoWeekString(year, week):
+
+        return pd.to_datetime(year.astype(str) + "-W" + week.astype(str).str.zfill(2) + "-1",
+                              format = "%G-W%V-%u")
+
+    ##
+    #  Previous Fish Pool read, one full workbook parse per sheet
+    #
+    @staticmethod
+    def _fishPoolPerSheet(fileName):
+
+        _xls = pd.ExcelFile(fileName)
+
+        return pd.concat([pd.read_excel(fileName, sheet_name = sheet, skiprows = 1)
+                          for sheet in np.flip(np.array(_xls.sheet_names))], ignore_index = True)
+
+
+if __name__ == "__main__":
+
+    benchmark = Benchmark()
+
+    print("\n--- LOADERS ---")
+    print(benchmark.Loaders())
+
+    print("\n--- EXCEL ENGINES ---")
+    print(benchmark.Engines())
+
+    print("\n--- SCALING ---")
+    print(benchmark.Scaling((1, 10)))
+
+    print("\n--- FISH POOL SHEETS ---")
+    print(benchmark.FishPoolSheets())
+
+    print("\n--- MERGE ---")
+    print(benchmark.Merge())
+
+    print("\n--- WEEKLY LAST OBSERVATION ---")
+    print(benchmark.WeeklyLast())
+
+    print("\n--- BLOOMBERG BATCH ---")
+    print(benchmark.WeeklyBatch())
+
+    print("\n--- VALIDATION ---")
+    print(benchmark.Validation())
+
+    print("\n--- SSB TABLES ---")
+    print(benchmark.SsbTables())
+
+    print("\n--- MONTHLY DISAGGREGATION ---")
+    print(benchmark.Disaggregation())
+
+    print("\n--- BIOMASS CUBE ---")
+    print(benchmark.BiomassCube())
+
+    print("\n--- FX AND PRICE SCENARIOS ---")
+    print(benchmark.Scenarios())
+
+    print("\n--- ESCAPES WEEKLY AGGREGATION ---")
+    print(benchmark.Escapes())
+
+    print("\n--- ISO WEEK CONVERSION ---")
+    print(benchmark.IsoWeeks())
@@ -0,0 +1,200 @@
+##
+#  This module constructs the BiomassCube class
+##
+
+##
+#  Imports libraries needed
+#
+import numpy as np
+import pandas as pd
+
+##
+# This class holds the salmon biomass data as a dense county x month x
+# measure array, with integer-coded axes: counties in alphabetical order,
+# months as consecutive positions from the first reported month, and the
+# measure columns in loader order. County-months without any reported
+# rows are zero. National and per-county rollups are computed once, and
+# cumulative sums along the months answer the total of any county and
+# month range in constant time.
+#
+class BiomassCube:
+
+    ##
+    #  @param values   array of shape (counties, months, measures)
+    #  @param counties county names, one per row of values
+    #  @param first    (year, month) of the first month
+    #  @param measures measure names, one per last axis of values
+    #
+    def __init__(self, values, counties, first, measures):
+
+        self.values   = np.asarray(values, dtype = "float64")
+        self.counties = np.asarray(counties, dtype = object)
+        self.measures = np.asarray(measures, dtype = object)
+        self.first    = int(first[0]) * 12 + int(first[1]) - 1
+
+        if self.values.shape != (len(self.counties), self.values.shape[1], len(self.measures)):
+            raise ValueError(f"Values of shape {self.values.shape} do not match "
+                             f"{len(self.counties)} counties and {len(self.measures)} measures")
+
+        _codes     = self.first + np.arange(self.values.shape[1])
+        self.year  = _codes // 12
+        self.month = _codes % 12 + 1
+
+        ## Rollups, and cumulative sums over the months with the national totals as last county
+        self.national     = self.values.sum(axis = 0)
+        self.countyTotals = self.values.sum(axis = 1)
+
+        _stacked          = np.concatenate([self.values, self.national[None]], axis = 0)
+        self._cumulative  = np.zeros((_stacked.shape[0], _stacked.shape[1] + 1, _stacked.shape[2]))
+        np.cumsum(_stacked, axis = 1, out = self._cumulative[:, 1:])
+
+        self._countyIndex  = {name: i for i, name in enumerate(self.counties)}
+        self._measureIndex = {name: i for i, name in enumerate(self.measures)}
+
+    ##
+    #  Builds the cube from a tidy frame
+    #  @param data   dataframe with Year, Month, County and measure columns,
+    #                one row per Year/Month/County, as SalmonBiomassCounty()
+    #  @param county name of the county column
+    #  @return BiomassCube over every measure column of data
+    #
+    @classmethod
+    def FromFrame(cls, data, county = "County"):
+
+        _measures = [col for col in data.columns if col not in ["Year", "Month", county]]
+        _codes    = data["Year"].to_numpy("int64") * 12 + data["Month"].to_numpy("int64") - 1
+        _first    = _codes.min()
+
+        _countyCodes, _names = pd.factorize(data[county], sort = True)
+
+        _values = np.zeros((len(_names), _codes.max() - _first + 1, len(_measures)))
+        np.add.at(_values, (_countyCodes, _codes - _first), data[_measures].to_numpy("float64", na_value = 0.0))
+
+        return cls(_values, list(_names), (_first // 12, _first % 12 + 1), _measures)
+
+    ##
+    #  Position of a county on the first axis
+    #  @param county county name
+    #  @return integer index
+    #
+    def County(self, county):
+
+        if county not in self._countyIndex:
+            raise ValueError(f"Unknown county: {county}")
+
+        return self._countyIndex[county]
+
+    ##
+    #  Position of a month on the second axis
+    #  @param year  year
+    #  @param month month number, 1 for January
+    #  @return integer index
+    #
+    def Month(self, year, month):
+
+        _position = int(year) * 12 + int(month) - 1 - self.first
+
+        if not 0 <= _position < self.values.shape[1]:
+            raise ValueError(f"Month {year}-{month:02d} outside the cube, "
+                             f"{self.year[0]}-{self.month[0]:02d} to {self.year[-1]}-{self.month[-1]:02d}")
+
+        return _position
+
+    ##
+    #  Values of a county and month range, a view of the cube when a single
+    #  or all counties and measures are selected
+    #  @param counties county name, list of names, or None for all
+    #  @param start    (year, month) of the first month, None from the first
+    #  @param end      (year, month) of the last month included, None to the last
+    #  @param measures measure name, list of names, or None for all
+    #  @return array with the axes of the cube, those selected by a single name dropped
+    #
+    def Slice(self, counties = None, start = None, end = None, measures = None):
+
+        ## Axes indexed one at a time, so that lists of counties and measures select their cross product
+        _values = self.values[:, self._months(start, end)][:, :, self._measures(measures)]
+
+        return _values[self._counties(counties)]
+
+    ##
+    #  Sum of a county and month range, in constant time. Stock measures,
+    #  fish and biomass held, are summed as well, divide by the number of
+    #  months for their average
+    #  @param county   county name, or None for the national total
+    #  @param start    (year, month) of the first month, None from the first
+    #  @param end      (year, month) of the last month included, None to the last
+    #  @param measures measure name, list of names, or None for all
+    #  @return float for a measure name, array per measure otherwise
+    #
+    def Total(self, county = None, start = None, end = None, measures = None):
+
+        _row    = len(self.counties) if county is None else self.County(county)
+        _months = self._months(start, end)
+
+        return (self._cumulative[_row, _months.stop, self._measures(measures)]
+                - self._cumulative[_row, _months.start, self._measures(measures)])
+
+    ##
+    #  Monthly series of a county or of the national totals
+    #  @param county   county name, or None for the national totals
+    #  @param measures measure name, list of names, or None for all
+    #  @return dataframe with Year, Month (int64) and the measure columns
+    #
+    def Series(self, county = None, measures = None):
+
+        _values   = self.national if county is None else self.values[self.County(county)]
+        _measures = self._measures(measures)
+        _names    = np.atleast_1d(self.measures[_measures])
+
+        dataTransform = pd.DataFrame(_values[:, _measures].reshape(len(self.year), len(_names)), columns = _names)
+        dataTransform.insert(0, "Year", self.year)
+        dataTransform.insert(1, "Month", self.month)
+
+        return dataTransform
+
+    ##
+    #  Tidy frame of the cube, one row per county and month
+    #  @return dataframe with Year, Month, County and the measure columns
+    #
+    def Frame(self):
+
+        _counties, _months = len(self.counties), len(self.year)
+
+        dataTransform = pd.DataFrame(self.values.reshape(_counties * _months, -1), columns = list(self.measures))
+        dataTransform.insert(0, "Year", np.tile(self.year, _counties))
+        dataTransform.insert(1, "Month", np.tile(self.month, _counties))
+        dataTransform.insert(2, "County", np.repeat(self.counties, _months))
+
+        return dataTransform
+
+    def _counties(self, counties):
+
+        if counties is None:
+            return slice(None)
+
+        if isinstance(counties, str):
+            return self.County(counties)
+
+        return np.array([self.County(county) for county in counties], dtype = "int64")
+
+    def _measures(self, measures):
+
+        if measures is None:
+            return slice(None)
+
+        if isinstance(measures, str):
+            if measures not in self._measureIndex:
+                raise ValueError(f"Unknown measure: {measures}")
+            return self._measureIndex[measures]
+
+        return np.array([self._measures(measure) for measure in measures], dtype = "int64")
+
+    def _months(self, start, end):
+
+        _start = 0 if start is None else self.Month(*start)
+        _end   = self.values.shape[1] - 1 if end is None else self.Month(*end)
+
+        if _end < _start:
+            raise ValueError(f"Month range ends before it starts: {start} to {end}")
+
+        return slice(_start, _end + 1)
@@ -0,0 +1,182 @@
+##
+#  This module constructs the ColumnarStore class
+##
+
+##
+#  Imports libraries needed
+#
+import importlib.util
+import json
+import logging
+import os
+
+import pandas as pd
+
+from data_cache import DataCache
+
+##
+# This class keeps the clean dataset of each source workbook as a typed
+# columnar file, Parquet when pyarrow is installed and NPZ otherwise, in a
+# directory mirroring the Data/ tree. Files are written once per vendor
+# drop by convert_data.py; a JSON sidecar records the source fingerprint
+# and loader code version, so a converted file is only used while both
+# still match. Loaders fall back to the workbook otherwise.
+#
+class ColumnarStore:
+
+    PARQUET     = importlib.util.find_spec("pyarrow") is not None
+    META_SUFFIX = ".json"
+    DEFAULT_DIR = "Data/Converted"
+
+    ##
+    #  @param directory root of the converted files
+    #  @param root      directory of the source tree mirrored under directory
+    #  @param fileFormat "parquet", "npz", or None for parquet when pyarrow is installed
+    #  @param update    None only reads converted files, "stale" writes the
+    #                   missing and stale ones, "all" rewrites every file
+    #
+    def __init__(self, directory = DEFAULT_DIR, root = "Data", fileFormat = None, update = None):
+
+        if update not in (None, "stale", "all"):
+            raise ValueError(f"Unknown update mode: {update}")
+
+        self.directory  = directory
+        self.root       = root
+        self.fileFormat = fileFormat or ("parquet" if self.PARQUET else "npz")
+        self.update     = update
+        self.written    = []
+        self._cache     = DataCache(cacheDir = None)
+
+    ##
+    #  Returns the converted dataset of a loader call, loading the workbook
+    #  when the converted file is missing or stale, and writing it back in
+    #  update mode
+    #  @param loaderName  name of the loader method
+    #  @param fileName    source workbook
+    #  @param args        positional arguments of the loader call
+    #  @param codeVersion hash of the loader source code
+    #  @param load        callable returning the clean dataframe from the workbook
+    #  @return clean dataframe
+    #
+    def Load(self, loaderName, fileName, args, codeVersion, load):
+
+        _data = self.Read(fileName, args, codeVersion) if self.update != "all" else None
+
+        if _data is not None:
+            return _data
+
+        _data = load()
+
+        if self.update is not None:
+            self.written.append(self.Write(fileName, _data, loaderName, args, codeVersion))
+        else:
+            logging.getLogger("data_loader").warning("No current converted file for %s, reading the workbook",
+                                                     fileName)
+
+        return _data
+
+    ##
+    #  Path of the converted file of a source workbook, without extension
+    #  @param fileName source workbook
+    #  @return path under directory
+    #
+    def Path(self, fileName):
+
+        _relative = os.path.relpath(os.path.abspath(fileName), os.path.abspath(self.root))
+
+        if _relative.startswith(os.pardir):
+            _relative = os.path.basename(fileName)
+
+        return os.path.join(self.directory, os.path.splitext(_relative)[0])
+
+    ##
+    #  Writes the clean dataset of a source workbook
+    #  @param fileName    source workbook
+    #  @param data        clean dataframe returned by its loader
+    #  @param loaderName  name of the loader method
+    #  @param args        positional arguments of the loader call
+    #  @param codeVersion hash of the loader source code
+    #  @return path of the written file
+    #
+    def Write(self, fileName, data, loaderName, args, codeVersion):
+
+        _path = self.Path(fileName)
+        _file = _path + "." + self.fileFormat
+        _tmp  = f"{_file}.{os.getpid()}.tmp"
+
+        os.makedirs(os.path.dirname(_path), exist_ok = True)
+
+        if self.fileFormat == "parquet":
+            data.to_parquet(_tmp, index = False)
+        else:
+            with open(_tmp, "wb") as _handle:
+                DataCache._writeFrame(_handle, data, {})
+
+        os.replace(_tmp, _file)
+
+        _meta = {"loader"     : loaderName,
+                 "args"       : [str(a) for a in args],
+                 "format"     : self.fileFormat,
+                 "source"     : self._cache.Fingerprint(fileName),
+                 "codeVersion": codeVersion,
+                 "rows"       : len(data)}
+
+        with open(_path + self.META_SUFFIX, "w", encoding = "utf-8") as _handle:
+            json.dump(_meta, _handle, indent = 1)
+
+        return _file
+
+    ##
+    #  Reads the clean dataset of a source workbook
+    #  @param fileName    source workbook
+    #  @param args        positional arguments of the loader call
+    #  @param codeVersion hash of the current loader source code
+    #  @return dataframe, or None when the file is missing or stale
+    #
+    def Read(self, fileName, args, codeVersion):
+
+        _path = self.Path(fileName)
+
+        if self.Status(fileName, args, codeVersion) != "current":
+            return None
+
+        with open(_path + self.META_SUFFIX, encoding = "utf-8") as _handle:
+            _format = json.load(_handle)["format"]
+
+        if _format == "parquet":
+            return pd.read_parquet(_path + ".parquet")
+
+        return DataCache._readFrame(_path + ".npz")[0]
+
+    ##
+    #  State of the converted file of a source workbook
+    #  @param fileName    source workbook
+    #  @param args        positional arguments of the loader call, not
+    #                     checked when None
+    #  @param codeVersion hash of the current loader source code
+    #  @return "missing", "stale" or "current"
+    #
+    def Status(self, fileName, args, codeVersion):
+
+        try:
+            with open(self.Path(fileName) + self.META_SUFFIX, encoding = "utf-8") as _handle:
+                _meta = json.load(_handle)
+        except (OSError, ValueError):
+            return "missing"
+
+        if not os.path.exists(self.Path(fileName) + "." + _meta["format"]):
+            return "missing"
+
+        if (args is not None and _meta["args"] != [str(a) for a in args]) or _meta["codeVersion"] != codeVersion:
+            return "stale"
+
+        ## Without the workbook, as on a run host receiving only converted files, the file is trusted
+        if os.path.exists(fileName):
+            _source = _meta["source"]
+            _stat   = os.stat(fileName)
+
+            if (_stat.st_size, _stat.st_mtime_ns) != (_source["size"], _source["mtime"]) \
+                    and self._cache.Fingerprint(fileName)["sha256"] != _source["sha256"]:
+                return "stale"
+
+        return "current"
@@ -0,0 +1,81 @@
+##
+#  This program converts the source workbooks into columnar files
+#
+#  Run it when a vendor drop lands in Data/; DataLoader(columnarDir = ...)
+#  then reads the converted files instead of parsing the workbooks:
+#
+#      python convert_data.py                  converts the new and changed workbooks
+#      python convert_data.py --all            converts every workbook again
+#      python convert_data.py --status         lists the state of each converted file
+#
+
+##
+# Imports libraries needed
+#
+import argparse
+import os
+import sys
+import time
+
+from columnar_store import ColumnarStore
+from data_cache import _codeVersion
+from data_loader import DataLoader
+
+##
+#  Converts the workbooks referenced by the DataLoader path constants
+#  @param argv command-line arguments, sys.argv when None
+#  @return exit status
+#
+def main(argv = None):
+
+    _parser = argparse.ArgumentParser(description = "Converts the DataLoader source workbooks into columnar files.")
+    _parser.add_argument("--output", default = ColumnarStore.DEFAULT_DIR, help = "directory of the converted files")
+    _parser.add_argument("--root", default = "Data", help = "source tree mirrored under the output directory")
+    _parser.add_argument("--format", choices = ["parquet", "npz"], default = None,
+                         help = "file format, parquet when pyarrow is installed, npz otherwise")
+    _parser.add_argument("--all", action = "store_true", help = "converts every workbook, current ones included")
+    _parser.add_argument("--status", action = "store_true", help = "lists the state of each converted file only")
+    _parser.add_argument("sources", nargs = "*", help = "loader names to convert, all when omitted")
+    _args = _parser.parse_args(argv)
+
+    _loader  = DataLoader(cacheDir = None)
+    _store   = ColumnarStore(_args.output, _args.root, _args.format, update = "all" if _args.all else "stale")
+    _unknown = [name for name in _args.sources if name not in _loader.SOURCE_FILES]
+
+    if _unknown:
+        _parser.error(f"unknown sources: {', '.join(_unknown)}")
+
+    if _args.status:
+        for _name in _args.sources or _loader.SOURCE_FILES:
+            _fileName = getattr(_loader, _loader.SOURCE_FILES[_name])
+            _status   = _store.Status(_fileName, None, _codeVersion(DataLoader))
+            print(f"{_status:8} {_name:22} {_fileName}")
+        return 0
+
+    _loader.columnar = _store
+
+    for _name in _args.sources or _loader.SOURCE_FILES:
+        _written = len(_store.written)
+        _start   = time.perf_counter()
+        _data    = getattr(_loader, _name)()
+        _action  = "wrote" if len(_store.written) > _written else "current"
+
+        print(f"{_action:8} {_name:22} {len(_data):6} rows {time.perf_counter() - _start:7.3f}s  "
+              f"{getattr(_loader, _loader.SOURCE_FILES[_name])}")
+
+    ## Workbooks of the tree that no loader reads are left unconverted
+    _sources = {os.path.abspath(getattr(_loader, attr)) for attr in _loader.SOURCE_FILES.values()}
+
+    for _dir, _, _files in os.walk(_args.root):
+        for _file in sorted(_files):
+            _path = os.path.join(_dir, _file)
+
+            if _file.endswith((".xls", ".xlsx")) and os.path.abspath(_path) not in _sources:
+                print(f"skipped  {'':22} {'':16} {_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+
+    sys.exit(main())
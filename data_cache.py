@@ -0,0 +1,379 @@
+##
+#  This module constructs the DataCache class
+##
+
+##
+#  Imports libraries needed
+#
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+##
+# This class keeps the clean version of each dataset on disk, in a columnar
+# NPZ file per loader call. An entry is keyed on the source file fingerprint
+# (path, size, mtime and content hash) and on the loader code version, so the
+# Excel sources are only parsed again when the file or the code changes.
+#
+class DataCache:
+
+    VERSION       = "1"
+    EXTENSION     = ".npz"
+    DEFAULT_DIR   = ".cache/data_loader"
+    DEFAULT_BYTES = 512 * 1024 ** 2
+
+    def __init__(self, cacheDir = DEFAULT_DIR, maxBytes = DEFAULT_BYTES):
+
+        self.cacheDir = cacheDir
+        self.maxBytes = maxBytes
+
+    ##
+    #  Describes a source file by path, size, modification time and content
+    #  @param fileName path of the source file
+    #  @return dictionary with the file fingerprint
+    #
+    def Fingerprint(self, fileName):
+
+        _path = os.path.abspath(fileName)
+        _stat = os.stat(_path)
+        _hash = hashlib.sha256()
+
+        with open(_path, "rb") as _file:
+            for _chunk in iter(lambda: _file.read(1024 * 1024), b""):
+                _hash.update(_chunk)
+
+        return {"path"  : _path,
+                "size"  : _stat.st_size,
+                "mtime" : _stat.st_mtime_ns,
+                "sha256": _hash.hexdigest()}
+
+    ##
+    #  Builds the entry key of a loader call
+    #  @param loaderName name of the loader method
+    #  @param args       positional arguments of the loader call
+    #  @param fingerprint source file fingerprint
+    #  @param codeVersion hash of the loader source code
+    #  @return hexadecimal key
+    #
+    def Key(self, loaderName, args, fingerprint, codeVersion):
+
+        _payload = json.dumps([self.VERSION, loaderName, [str(a) for a in args],
+                               fingerprint, codeVersion], sort_keys = True)
+
+        return hashlib.sha256(_payload.encode("utf-8")).hexdigest()
+
+    ##
+    #  Returns the cached frame of a loader call, running and storing the
+    #  loader when there is no valid entry
+    #  @param loaderName  name of the loader method
+    #  @param fileName    source file read by the loader
+    #  @param args        positional arguments of the loader call
+    #  @param codeVersion hash of the loader source code
+    #  @param load        callable returning the clean dataframe
+    #  @return clean dataframe
+    #
+    def Load(self, loaderName, fileName, args, codeVersion, load):
+
+        _fingerprint = self.Fingerprint(fileName)
+        _key         = self.Key(loaderName, args, _fingerprint, codeVersion)
+        _data        = self.Get(_key)
+
+        if _data is None:
+            _data = load()
+            self.Put(_key, _data, {"loader"     : loaderName,
+                                   "args"       : [str(a) for a in args],
+                                   "source"     : _fingerprint["path"],
+                                   "sha256"     : _fingerprint["sha256"],
+                                   "codeVersion": codeVersion})
+
+        return _data
+
+    ##
+    #  Reads an entry and marks it as recently used
+    #  @param key entry key
+    #  @return dataframe, or None when the entry does not exist
+    #
+    def Get(self, key):
+
+        _path = self._entryPath(key)
+
+        try:
+            _data, _ = self._readFrame(_path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        os.utime(_path)
+
+        return _data
+
+    ##
+    #  Writes an entry and evicts the least recently used ones when the
+    #  cache grows beyond its size limit
+    #  @param key  entry key
+    #  @param data dataframe to store
+    #  @param info metadata describing the entry
+    #
+    def Put(self, key, data, info):
+
+        os.makedirs(self.cacheDir, exist_ok = True)
+
+        _path = self._entryPath(key)
+        _tmp  = f"{_path}.{os.getpid()}.tmp"
+
+        with open(_tmp, "wb") as _file:
+            self._writeFrame(_file, data, dict(info, key = key, created = time.time()))
+
+        os.replace(_tmp, _path)
+
+        self._evict()
+
+    ##
+    #  Lists the stored entries
+    #  @return dataframe with one row per entry, most recently used first
+    #
+    def Entries(self):
+
+        _rows = []
+
+        for _path in self._entryPaths():
+            try:
+                _meta = self._readMeta(_path)
+                _stat = os.stat(_path)
+            except (OSError, ValueError, KeyError):
+                continue
+
+            _rows.append({"key"       : _meta["key"],
+                          "loader"    : _meta["loader"],
+                          "args"      : tuple(_meta["args"]),
+                          "source"    : _meta["source"],
+                          "rows"      : _meta["rows"],
+                          "bytes"     : _stat.st_size,
+                          "created"   : pd.to_datetime(_meta["created"], unit = "s"),
+                          "lastAccess": pd.to_datetime(_stat.st_mtime, unit = "s")})
+
+        _columns = ["key", "loader", "args", "source", "rows", "bytes", "created", "lastAccess"]
+        entries  = pd.DataFrame(_rows, columns = _columns)
+
+        return entries.sort_values("lastAccess", ascending = False).reset_index(drop = True)
+
+    ##
+    #  Total size of the stored entries
+    #  @return size in bytes
+    #
+    def Size(self):
+
+        return sum(os.path.getsize(_path) for _path in self._entryPaths())
+
+    ##
+    #  Removes the entries of a source file and/or a loader
+    #  @param fileName source file whose entries are removed, all when None
+    #  @param loaderName loader whose entries are removed, all when None
+    #  @return number of removed entries
+    #
+    def Invalidate(self, fileName = None, loaderName = None):
+
+        _source  = os.path.abspath(fileName) if fileName is not None else None
+        _removed = 0
+
+        for _path in self._entryPaths():
+            try:
+                _meta = self._readMeta(_path)
+            except (OSError, ValueError, KeyError):
+                _meta = None
+
+            if _meta is not None:
+                if _source is not None and _meta["source"] != _source:
+                    continue
+                if loaderName is not None and _meta["loader"] != loaderName:
+                    continue
+
+            _removed += self._remove(_path)
+
+        return _removed
+
+    ##
+    #  Removes every entry
+    #  @return number of removed entries
+    #
+    def Clear(self):
+
+        return self.Invalidate()
+
+    ##
+    #  Drops the least recently used entries until the cache fits maxBytes
+    #
+    def _evict(self):
+
+        if self.maxBytes is None:
+            return
+
+        _entries = []
+
+        for _path in self._entryPaths():
+            try:
+                _stat = os.stat(_path)
+            except OSError:
+                continue
+            _entries.append((_stat.st_mtime_ns, _stat.st_size, _path))
+
+        _total = sum(_size for _, _size, _ in _entries)
+
+        for _, _size, _path in sorted(_entries):
+            if _total <= self.maxBytes:
+                break
+            _total -= _size
+            self._remove(_path)
+
+    def _entryPath(self, key):
+
+        return os.path.join(self.cacheDir, key + self.EXTENSION)
+
+    def _entryPaths(self):
+
+        if not os.path.isdir(self.cacheDir):
+            return []
+
+        return [os.path.join(self.cacheDir, _name) for _name in sorted(os.listdir(self.cacheDir))
+                if _name.endswith(self.EXTENSION)]
+
+    @staticmethod
+    def _remove(path):
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return 0
+
+        return 1
+
+    ##
+    #  Stores a dataframe column by column, with names and dtypes in a JSON header
+    #
+    @staticmethod
+    def _writeFrame(file, data, info):
+
+        _meta    = dict(info, columns = [str(c) for c in data.columns],
+                        dtypes = [str(t) for t in data.dtypes], rows = len(data))
+        _arrays  = {f"c{i}": DataCache._columnArray(data.iloc[:, i]) for i in range(data.shape[1])}
+        _default = isinstance(data.index, pd.RangeIndex) and data.index.equals(pd.RangeIndex(len(data)))
+
+        if not _default:
+            _arrays["index"] = data.index.to_numpy()
+
+        _meta["defaultIndex"] = _default
+
+        np.savez(file, meta = np.array(json.dumps(_meta)), **_arrays)
+
+    ##
+    #  Column as a NumPy array readable without pickle, complete text
+    #  columns as fixed-width unicode
+    #
+    @staticmethod
+    def _columnArray(series):
+
+        _values = series.to_numpy()
+
+        if _values.dtype == object and series.notna().all() and all(isinstance(v, str) for v in _values):
+            return _values.astype(str)
+
+        return _values
+
+    @staticmethod
+    def _readFrame(path):
+
+        with np.load(path, allow_pickle = False) as _npz:
+            _meta   = json.loads(_npz["meta"].item())
+            _values = {_name: _npz[f"c{i}"].astype(_dtype, copy = False)
+                       for i, (_name, _dtype) in enumerate(zip(_meta["columns"], _meta["dtypes"]))}
+            _index  = pd.RangeIndex(_meta["rows"]) if _meta["defaultIndex"] else _npz["index"]
+
+        return pd.DataFrame(_values, index = _index, columns = _meta["columns"]), _meta
+
+    @staticmethod
+    def _readMeta(path):
+
+        with np.load(path, allow_pickle = False) as _npz:
+            return json.loads(_npz["meta"].item())
+
+
+##
+#  Hash of the source code of a class and of the project modules it
+#  depends on, used as the loader code version: the modules next to the
+#  class module that it imports, directly or through one another, such as
+#  the calendar, SSB table and cache modules the loaders call into
+#
+@functools.lru_cache(maxsize = None)
+def _codeVersion(cls):
+
+    _hash = hashlib.sha256(inspect.getsource(cls).encode("utf-8"))
+
+    for _module in _projectModules(inspect.getmodule(cls)):
+        _hash.update(inspect.getsource(_module).encode("utf-8"))
+
+    return _hash.hexdigest()
+
+
+##
+#  Modules of the directory of a module imported by it, transitively
+#  @param module module object
+#  @return list of modules, the module itself first, then by name
+#
+def _projectModules(module):
+
+    _directory = os.path.dirname(os.path.abspath(module.__file__))
+    _found     = {module.__name__: module}
+    _pending   = [module]
+
+    while _pending:
+        for _value in vars(_pending.pop()).values():
+            _imported = _value if inspect.ismodule(_value) else inspect.getmodule(_value)
+            _file     = getattr(_imported, "__file__", None)
+
+            if _file is not None and _imported.__name__ not in _found \
+                    and os.path.dirname(os.path.abspath(_file)) == _directory:
+                _found[_imported.__name__] = _imported
+                _pending.append(_imported)
+
+    return [module] + [_found[name] for name in sorted(_found) if name != module.__name__]
+
+
+##
+#  Decorator placing the converted columnar files and the DataLoader cache
+#  in front of a loader method
+#  @param fileAttr class attribute holding the source file; when None the
+#                  first positional argument of the method is the source file
+#  @param columnar False for loaders sharing their workbook with a panel
+#                  loader, whose converted file is named after the workbook
+#
+def cached(fileAttr = None, columnar = True):
+
+    def decorator(method):
+
+        @functools.wraps(method)
+        def wrapper(self, *args):
+
+            _fileName = getattr(self, fileAttr) if fileAttr is not None else args[0]
+
+            def load():
+
+                if self.cache is None:
+                    return method(self, *args)
+
+                return self.cache.Load(method.__name__, _fileName, args, _codeVersion(type(self)),
+                                       lambda: method(self, *args))
+
+            ## Converted columnar files take precedence over the workbooks
+            if columnar and getattr(self, "columnar", None) is not None:
+                return self.columnar.Load(method.__name__, _fileName, args, _codeVersion(type(self)), load)
+
+            return load()
+
+        return wrapper
+
+    return decorator
@@ -5,9 +5,28 @@
 ##
 #  Imports libraries needed
 #
+import importlib.util
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import openpyxl
 import pandas as pd
 import numpy as np
 
+from columnar_store import ColumnarStore
+from biomass_cube import BiomassCube
+from data_cache import DataCache, cached
+from instrumentation import NULL_TRACKER
+from iso_calendar import IsoCalendar
+from lazy_data import LazyData
+from model_matrix import ModelMatrix
+from ssb_table import SsbTable
+from temporal_disaggregation import TemporalDisaggregation
+from validation_report import ValidationReport
+
 ##
 # This class loads, processes the several salmon data time series
 # addressed in the Thesis. For each dataset, returns the clean version.
@@ -44,8 +63,147 @@ class DataLoader:
     EQUITY_PRICE_MOWI      = _salmon + _salmonEquity + "Price_MOWI.xlsx"
     EQUITY_PRICE_SALMAR    = _salmon + _salmonEquity + "Price_SALMAR.xlsx"
 
-    def __init__(self):
-        pass
+    ## Loader method and the path constant of the file it reads
+    SOURCE_FILES = {
+        "SalmonPriceFishPool"  : "SALMON_PRICE_FISHPOOL",
+        "SalmonPriceSSB"       : "SALMON_PRICE_SSB",
+        "SalmonPriceBloomberg" : "SALMON_PRICE_BLOOMBERG",
+        "SalmonEscapes"        : "SALMON_ESCAPES",
+        "ProteinBroilerPrice"  : "PROTEIN_PRICE_BROILER",
+        "ProteinPigPrice"      : "PROTEIN_PRICE_PIG",
+        "EURNOK"               : "CURRENCY_EURNOK",
+        "USDNOK"               : "CURRENCY_USDNOK",
+        "CommodityBrentPrice"  : "COMMODITY_BRENT",
+        "CommodityWheatPrice"  : "COMMODITY_WHEAT",
+        "CommoditySoybeanPrice": "COMMODITY_SOYBEAN",
+        "CommodityRapseedPrice": "COMMODITY_RAPSEED",
+        "EquityMOWIPrice"      : "EQUITY_PRICE_MOWI",
+        "EquitySALMARPrice"    : "EQUITY_PRICE_SALMAR",
+        "CPINorway"            : "CPI_NORWAY",
+        "ProteinCPIMeat"       : "PROTEIN_CPI_MEAT",
+        "SalmonBiomass"        : "SALMON_BIOMASS",
+        "SalmonExport"         : "SALMON_EXPORTS"
+    }
+
+    ## Panel columns produced by each loader
+    SOURCE_COLUMNS = {
+        "SalmonPriceFishPool"  : ["Salmon_NOK_kg_FP_Weekly", "Salmon_EUR_kg_FP_Weekly"],
+        "SalmonPriceSSB"       : ["Salmon_Exported_Tons_SSB_Weekly", "Salmon_NOK_kg_SSB_Weekly"],
+        "SalmonPriceBloomberg" : ["Salmon_NOK_kg_BB_Weekly"],
+        "SalmonEscapes"        : ["Salmon_Escapes_Rep_Escaped_Weekly", "Salmon_Escapes_Avg_Wt_Grams_Weekly",
+                                  "Salmon_Escapes_Recapture_Weekly"],
+        "ProteinBroilerPrice"  : ["Protein_Broiler_EUR_100_kg_Weekly"],
+        "ProteinPigPrice"      : ["Protein_Pig_EUR_100_kg_Weekly"],
+        "EURNOK"               : ["EURNOK_Weekly"],
+        "USDNOK"               : ["USDNOK_Weekly"],
+        "CommodityBrentPrice"  : ["Commodity_Brent_NOK_bbl_Weekly"],
+        "CommodityWheatPrice"  : ["Commodity_Wheat_NOK_mt_Weekly"],
+        "CommoditySoybeanPrice": ["Commodity_Soybean_NOK_st_Weekly"],
+        "CommodityRapseedPrice": ["Commodity_Rapseed_NOK_mt_Weekly"],
+        "EquityMOWIPrice"      : ["Equity_MOWI_NOK_Weekly"],
+        "EquitySALMARPrice"    : ["Equity_SALMAR_NOK_Weekly"],
+        "CPINorway"            : ["CPI_Norway_Monthly"],
+        "ProteinCPIMeat"       : ["Protein_CPI_Meat_Monthly"],
+        "SalmonBiomass"        : ["Salmon_Biomass_Fish_Stock_Monthly", "Salmon_Biomass_Kg_Monthly",
+                                  "Salmon_Biomass_Smolt_Stock_Monthly", "Salmon_Biomass_Feed_Kg_Monthly",
+                                  "Salmon_Biomass_Harvest_Kg_Monthly", "Salmon_Biomass_Harvest_N_Monthly",
+                                  "Salmon_Biomass_Mortality_N_Monthly", "Salmon_Biomass_Discard_N_Monthly",
+                                  "Salmon_Biomass_Escape_N_Monthly", "Salmon_Biomass_Other_Loss_N_Monthly"],
+        "SalmonExport"         : ["Salmon_Export_Net_Weight_Kg_Monthly", "Salmon_Export_Value_USD_Monthly",
+                                  "Salmon_Export_Avg_Price_USD_Kg_Monthly"]
+    }
+
+    ## Reported escapes: a count, or an "E:low - high" estimate taken at its midpoint
+    ESCAPE_ESTIMATE = re.compile(r"^\s*(?:E:)?\s*(\d+(?:\.\d+)?)\s*(?:-\s*(\d+(?:\.\d+)?))?\s*$")
+
+    ## Price columns and the decimals they are quoted with, the float32 candidates of Compact()
+    PRICE_DECIMALS = {"Salmon_NOK_kg_FP_Weekly"               : 2,
+                      "Salmon_EUR_kg_FP_Weekly"               : 2,
+                      "Salmon_NOK_kg_SSB_Weekly"              : 2,
+                      "Salmon_NOK_kg_BB_Weekly"               : 2,
+                      "Protein_Broiler_EUR_100_kg_Weekly"     : 2,
+                      "Protein_Pig_EUR_100_kg_Weekly"         : 2,
+                      "EURNOK_Weekly"                         : 4,
+                      "USDNOK_Weekly"                         : 4,
+                      "Commodity_Brent_NOK_bbl_Weekly"        : 5,
+                      "Commodity_Wheat_NOK_mt_Weekly"         : 5,
+                      "Commodity_Soybean_NOK_st_Weekly"       : 5,
+                      "Commodity_Rapseed_NOK_mt_Weekly"       : 5,
+                      "Equity_MOWI_NOK_Weekly"                : 3,
+                      "Equity_SALMAR_NOK_Weekly"              : 2,
+                      "Salmon_Export_Avg_Price_USD_Kg_Monthly": 4}
+
+    ## Last week kept in the panel
+    CUTOFF = "2025-12-28"
+
+    ## Sources merged by Date and by Year/Month, in panel column order
+    WEEKLY_SOURCES  = ["SalmonPriceSSB", "SalmonPriceBloomberg", "SalmonEscapes",
+                       "ProteinBroilerPrice", "ProteinPigPrice",
+                       "EURNOK", "USDNOK",
+                       "CommodityBrentPrice", "CommodityWheatPrice", "CommoditySoybeanPrice", "CommodityRapseedPrice",
+                       "EquityMOWIPrice", "EquitySALMARPrice"]
+    MONTHLY_SOURCES = ["CPINorway", "ProteinCPIMeat", "SalmonBiomass", "SalmonExport"]
+
+    ## Monthly columns that are totals over the month, disaggregated so that their weeks sum to it
+    MONTHLY_FLOWS = ["Salmon_Biomass_Smolt_Stock_Monthly", "Salmon_Biomass_Feed_Kg_Monthly",
+                     "Salmon_Biomass_Harvest_Kg_Monthly", "Salmon_Biomass_Harvest_N_Monthly",
+                     "Salmon_Biomass_Mortality_N_Monthly", "Salmon_Biomass_Discard_N_Monthly",
+                     "Salmon_Biomass_Escape_N_Monthly", "Salmon_Biomass_Other_Loss_N_Monthly",
+                     "Salmon_Export_Net_Weight_Kg_Monthly", "Salmon_Export_Value_USD_Monthly"]
+
+    ## Biomass sheet columns summed per month, and their panel names
+    BIOMASS_COLUMNS = {" BEHFISK_STK"     : "Salmon_Biomass_Fish_Stock",
+                       " BIOMASSE_KG"     : "Salmon_Biomass_Kg",
+                       " UTSETT_SMOLT_STK": "Salmon_Biomass_Smolt_Stock",
+                       " FORFORBRUK_KG"   : "Salmon_Biomass_Feed_Kg",
+                       " UTTAK_KG"        : "Salmon_Biomass_Harvest_Kg",
+                       " UTTAK_STK"       : "Salmon_Biomass_Harvest_N",
+                       " DØDFISK_STK"     : "Salmon_Biomass_Mortality_N",
+                       " UTKAST_STK"      : "Salmon_Biomass_Discard_N",
+                       " RØMMING_STK"     : "Salmon_Biomass_Escape_N",
+                       " ANDRE_STK"       : "Salmon_Biomass_Other_Loss_N"}
+
+    ## County of biomass rows reported without one, as the sheet labels them
+    BIOMASS_UNKNOWN = "Uoppgitt"
+
+    ## Weekly sources in the Bloomberg Date/Last Price layout
+    BLOOMBERG_SOURCES = ["SalmonPriceBloomberg", "ProteinBroilerPrice", "ProteinPigPrice",
+                         "EURNOK", "USDNOK",
+                         "CommodityBrentPrice", "CommodityWheatPrice", "CommoditySoybeanPrice", "CommodityRapseedPrice",
+                         "EquityMOWIPrice", "EquitySALMARPrice"]
+
+    ## Excel engine used when python-calamine is installed, pandas' default otherwise
+    CALAMINE = importlib.util.find_spec("python_calamine") is not None
+
+    ## Engines accepted by pd.read_excel, None being pandas' default for the extension
+    ENGINES  = ["calamine", "openpyxl", "xlrd", None]
+
+    ##
+    #  @param cacheDir      directory of the on-disk dataset cache, None disables it
+    #  @param cacheMaxBytes size limit of the cache, least recently used entries
+    #                       are evicted beyond it
+    #  @param instrumentation Instrumentation recording each loader and merge
+    #                         stage, None disables it
+    #  @param engine        Excel engine: "auto" for calamine when installed,
+    #                       one of ENGINES, or a dictionary of loader name or
+    #                       file path to engine, "auto" for the others. The
+    #                       streamed biomass sheet keeps openpyxl under "auto"
+    #  @param checkEngine   reads each file again with pandas' default engine
+    #                       and raises ValueError when the frames differ
+    #  @param columnarDir   directory of the files written by convert_data.py,
+    #                       read instead of the workbooks while current; None
+    #                       always reads the workbooks
+    #
+    def __init__(self, cacheDir = DataCache.DEFAULT_DIR, cacheMaxBytes = DataCache.DEFAULT_BYTES,
+                 instrumentation = None, engine = "auto", checkEngine = False, columnarDir = None):
+
+        self.cache           = DataCache(cacheDir, cacheMaxBytes) if cacheDir is not None else None
+        self.instrumentation = instrumentation
+        self.engine          = engine
+        self.checkEngine     = checkEngine
+        self.engines         = {}
+        self.columnar        = ColumnarStore(columnarDir) if columnarDir is not None else None
+        self.disaggregation  = {}
 
     ##                                                 ##
     # Upload the raw files and gets rid of the noise of #
@@ -58,22 +216,23 @@ class DataLoader:
     #  @dataset Fish Pool Index 3-6 kg Norwegian salmon price
     #  @return weekly salmon price per kg, in NOK and EUR
     #  
+    @cached("SALMON_PRICE_FISHPOOL")
     def SalmonPriceFishPool(self):
 
         ## Clean: Load file and format
+        ## The workbook is parsed once, every year sheet comes from the same read
         _fileName    = self.SALMON_PRICE_FISHPOOL
-        _xls         = pd.ExcelFile(_fileName)
-        _sheetNames  = np.flip(np.array(_xls.sheet_names))
-        _datasetList = []
-
-        for sheet in _sheetNames:
-            _data = pd.read_excel(_fileName, sheet_name=sheet, skiprows=1)
-            _datasetList.append(_data)
+        _track       = self._track("SalmonPriceFishPool")
+        _sheets      = self._readExcel(_fileName, sheet_name=None, skiprows=1)
+        _datasetList = list(_sheets.values())[::-1]
 
         dataClean = pd.concat(_datasetList, ignore_index=True)
+        _track.Mark("read", dataClean)
+
         dataClean["Month"] = pd.to_datetime(dataClean["Month"], format="%B").dt.month
         dataClean.rename(columns={"NOK/kg": "Salmon_NOK_kg_FP_Weekly",
                                 "EUR/kg": "Salmon_EUR_kg_FP_Weekly"}, inplace=True)
+        _track.Mark("clean", dataClean)
         
         ## Transform: validate datatypes and frequency match
         dataTransform = dataClean.copy()
@@ -84,6 +243,7 @@ class DataLoader:
                           "Salmon_NOK_kg_FP_Weekly": "float64",
                           "Salmon_EUR_kg_FP_Weekly": "float64"
                            }) 
+        _track.Mark("transform", dataTransform)
         
         return dataTransform
     
@@ -93,23 +253,21 @@ class DataLoader:
     #  @dataset SSB exported salmon tons and price 
     #  @return weekly exported salmon tons and price per kilogram in NOK
     #
+    @cached("SALMON_PRICE_SSB")
     def SalmonPriceSSB(self):
 
         ## Clean  
         _fileName     = self.SALMON_PRICE_SSB
-        _data         = pd.read_excel(_fileName, header = None)
+        _track        = self._track("SalmonPriceSSB")
+        _data         = self._readExcel(_fileName, header = None)
+        _track.Mark("read", _data)
+
         _data         = _data.loc[3:,1:]
         _data         = _data.loc[:_data.dropna(how = "all").index[-1]]
-        _data.columns = ["Date", "Salmon_Exported_Tons_SSB_Weekly", "Salmon_NOK_kg_SSB_Weekly"]
 
-        dataClean          = _data.reset_index(drop = True)
-        dataClean["Year"]  = dataClean["Date"].astype(str).str[:4].astype(int)
-        dataClean["Week"]  = dataClean["Date"].astype(str).str[5:].astype(int)
-        dataClean["Month"] = pd.to_datetime(dataClean["Date"].astype(str).str[:4] + "-W" + dataClean["Date"].astype(str).str[5:] + "-1",
-                                            format= "%G-W%V-%u").dt.month
-        
-        dataClean = dataClean.drop(columns = ["Date"])
-        dataClean = dataClean[["Year", "Week", "Month", "Salmon_Exported_Tons_SSB_Weekly", "Salmon_NOK_kg_SSB_Weekly"]]
+        dataClean = SsbTable.Weekly(_data[1], {"Salmon_Exported_Tons_SSB_Weekly": _data[2],
+                                               "Salmon_NOK_kg_SSB_Weekly"       : _data[3]})
+        _track.Mark("clean", dataClean)
 
         ## Transform
         dataTransform = dataClean.copy()
@@ -120,6 +278,7 @@ class DataLoader:
                          "Salmon_Exported_Tons_SSB_Weekly": "float64",
                          "Salmon_NOK_kg_SSB_Weekly"       : "float64"
                          })
+        _track.Mark("transform", dataTransform)
         
         return dataTransform
     
@@ -142,17 +301,22 @@ class DataLoader:
     #  @dataset """"
     #  @return  monthly salmon exports in weight and value in USD ############
     #
+    @cached("SALMON_EXPORTS")
     def SalmonExport(self):
         
         ## Clean
         _fileName         = self.SALMON_EXPORTS
-        _data             = pd.read_excel(_fileName, sheet_name= "Sheet1")
+        _track            = self._track("SalmonExport")
+        _data             = self._readExcel(_fileName, sheet_name= "Sheet1")
+        _track.Mark("read", _data)
+
         _selectColumns    = ["refPeriodId", "netWgt", "primaryValueUSD", "AvgValueKg"]
         dataClean         = _data[_selectColumns].copy()
         _columnNames      = ["Date", "Salmon_Export_Net_Weight_Kg_Monthly", "Salmon_Export_Value_USD_Monthly"
                              , "Salmon_Export_Avg_Price_USD_Kg_Monthly"]
         dataClean.columns = _columnNames
         dataClean["Date"] = pd.to_datetime(dataClean["Date"], format = "%Y%m%d")
+        _track.Mark("clean", dataClean)
 
         ## Transform
         dataTransform          = dataClean.copy()
@@ -168,6 +332,7 @@ class DataLoader:
                                 "Salmon_Export_Value_USD_Monthly"       : "float64",
                                 "Salmon_Export_Avg_Price_USD_Kg_Monthly": "float64"
                                 })
+        _track.Mark("transform", dataTransform)
 
         return dataTransform
 
@@ -178,104 +343,172 @@ class DataLoader:
     #  @return  "panel" monthly production-area-level aquaculture data on stock, biomass,
     #           feed, harvest, and losses
     #
-    def SalmonBiomass(self): 
-
-        ## Cleans
-        _fileName      = self.SALMON_BIOMASS
-        _data          = pd.read_excel(_fileName, sheet_name="Biomasse-flk", skiprows=5)
-        _selectColumns = ["ÅR", " MÅNED_KODE", " FYLKE", " ARTSID",
-                        " BEHFISK_STK", " BIOMASSE_KG", " UTSETT_SMOLT_STK",
-                        " FORFORBRUK_KG", " UTTAK_KG", " UTTAK_STK", " DØDFISK_STK",
-                        " UTKAST_STK", " RØMMING_STK", " ANDRE_STK"]
-        dataClean      = _data[_selectColumns]
-        _columnNames   = ["Year", "Month", "Salmon_Biomass_County", "Salmon_Biomass_Species", "Salmon_Biomass_Fish_Stock",
-                        "Salmon_Biomass_Kg", "Salmon_Biomass_Smolt_Stock", "Salmon_Biomass_Feed_Kg", "Salmon_Biomass_Harvest_Kg", 
-                        "Salmon_Biomass_Harvest_N", "Salmon_Biomass_Mortality_N", "Salmon_Biomass_Discard_N", 
-                        "Salmon_Biomass_Escape_N", "Salmon_Biomass_Other_Loss_N"]
-        dataClean.columns = _columnNames
-        dataClean         = dataClean[dataClean["Salmon_Biomass_Species"] == "LAKS"]
-        dataClean         = dataClean.reset_index(drop = True) 
+    @cached("SALMON_BIOMASS")
+    def SalmonBiomass(self):
 
-        ## Transform
-        dataTransform = dataClean.copy()
-        dataTransform = (
-                         dataTransform
-                         .groupby(["Year", "Month"], as_index = False)
-                         .sum(numeric_only = True)
-        )
-        for col in dataTransform.columns:
-            if col not in ["Year", "Month"]:
-                dataTransform[col] = dataTransform[col].astype("float64")
+        ## Transform: Year/Month sums accumulate as the rows stream
+        _track = self._track("SalmonBiomass")
+        _sums  = self._biomassSums([])
+        _track.Mark("stream")
 
-        _colRename = dataTransform.columns.difference(["Year", "Month"])
+        _keys   = sorted(_sums)
+        _matrix = np.array([_sums[_key] for _key in _keys], dtype = "float64").reshape(len(_keys),
+                                                                                       len(self.BIOMASS_COLUMNS))
 
-        dataTransform = dataTransform.rename(
-            columns={col: col + "_Monthly" for col in _colRename}
-        )
+        dataTransform = pd.DataFrame(_matrix, columns = [col + "_Monthly" for col in self.BIOMASS_COLUMNS.values()])
+        dataTransform.insert(0, "Year", np.array([_key[0] for _key in _keys], dtype = "int64"))
+        dataTransform.insert(1, "Month", np.array([_key[1] for _key in _keys], dtype = "int64"))
+        _track.Mark("transform", dataTransform)
 
         return dataTransform
 
+    ##
+    #  Uploads, cleans and transforms the Biomass data per county, from the
+    #  same sheet as SalmonBiomass()
+    #  @dataset Directory of fisheries detailed biomass data
+    #  @return  "panel" monthly county-level aquaculture data, one row per
+    #           Year/Month/County, with the columns of SalmonBiomass()
+    #
+    @cached("SALMON_BIOMASS", columnar = False)
+    def SalmonBiomassCounty(self):
+
+        _track = self._track("SalmonBiomassCounty")
+        _sums  = self._biomassSums([" FYLKE"])
+        _track.Mark("stream")
+
+        _keys   = sorted(_sums)
+        _matrix = np.array([_sums[_key] for _key in _keys], dtype = "float64").reshape(len(_keys),
+                                                                                       len(self.BIOMASS_COLUMNS))
+
+        dataTransform = pd.DataFrame(_matrix, columns = [col + "_Monthly" for col in self.BIOMASS_COLUMNS.values()])
+        dataTransform.insert(0, "Year", np.array([_key[0] for _key in _keys], dtype = "int64"))
+        dataTransform.insert(1, "Month", np.array([_key[1] for _key in _keys], dtype = "int64"))
+        dataTransform.insert(2, "County", np.array([_key[2] for _key in _keys], dtype = object))
+        _track.Mark("transform", dataTransform)
+
+        return dataTransform
+
+    ##
+    #  County x month x measure cube of the salmon biomass data
+    #  @return BiomassCube of SalmonBiomassCounty(), with national and
+    #          per-county rollups
+    #
+    def BiomassCube(self):
+
+        return BiomassCube.FromFrame(self.SalmonBiomassCounty())
+
+    ##
+    #  Streams the salmon rows of the biomass sheet, summing the measures
+    #  @param keyColumns sheet columns grouped by besides year and month
+    #  @return dictionary of (year, month, *keys) to the sums of BIOMASS_COLUMNS
+    #
+    def _biomassSums(self, keyColumns):
+
+        _columns = ["ÅR", " MÅNED_KODE", " ARTSID"] + keyColumns + list(self.BIOMASS_COLUMNS)
+        _keys    = len(keyColumns)
+        _sums    = {}
+
+        for _year, _month, _species, *_values in self._iterSheet(self.SALMON_BIOMASS, "Biomasse-flk", 5, _columns):
+            if _species != "LAKS" or _year is None or _month is None:
+                continue
+
+            _key   = (_year, _month, *[self.BIOMASS_UNKNOWN if _value is None else str(_value).strip()
+                                       for _value in _values[:_keys]])
+            _total = _sums.get(_key)
+            if _total is None:
+                _total = _sums[_key] = np.zeros(len(self.BIOMASS_COLUMNS))
+
+            _total += [0 if _value is None else _value for _value in _values[_keys:]]
+
+        return _sums
+
     ##
     #  Uploads, cleans and transforms the Escapes time series data
     #  From week 12 January 2006 to 19 January 2026
     #  @dataset Directory of fisheries reported escapes per species
     #  @return "event" reported escapes per species, region, and company
     #
+    @cached("SALMON_ESCAPES")
     def SalmonEscapes(self):
         
         ## Clean
         _fileName                 = self.SALMON_ESCAPES
-        _data                     = pd.read_excel(_fileName)
+        _track                    = self._track("SalmonEscapes")
+        _data                     = self._readExcel(_fileName)
+        _track.Mark("read", _data)
+
         _selectColumns            = ["Dato", "Lokalitets- navn", "Lokalitets- nummer", "Fylke", 
                                     "Selskap", "Art", "Rømmings- estimat", "Rapportert rømt",
                                     "Snittvekt (gram)", "Gjenfangst"]
-        dataClean                = _data[_selectColumns]
-        dataClean.loc[:,"Dato"]  = pd.to_datetime(dataClean["Dato"], format = "%m/%d/%Y").dt.date   
-        dataClean                = dataClean.sort_values("Dato", ascending=True)
-        dataClean                = dataClean.reset_index(drop = True)                      
         _columnNames             = ["Date", "Salmon_Escapes_Site_Name", "Salmon_Escapes_Site_Number", 
                                     "Salmon_Escapes_County", "Salmon_Escapes_Company", "Salmon_Escapes_Species", 
                                     "Salmon_Escapes_Est_Num_Escaped", "Salmon_Escapes_Rep_Escaped", "Salmon_Escapes_Avg_Wt_Grams",
                                     "Salmon_Escapes_Recapture"]
-        dataClean.columns        = _columnNames
-        dataClean                = dataClean[dataClean["Salmon_Escapes_Species"] == "Laks"]
-        dataClean                = dataClean.reset_index(drop = True) 
+        dataClean                = _data[_selectColumns].set_axis(_columnNames, axis = 1)
+        dataClean                = dataClean[dataClean["Salmon_Escapes_Species"] == "Laks"].reset_index(drop = True)
+        dataClean["Date"]        = pd.to_datetime(dataClean["Date"], format = "%m/%d/%Y")
+        _track.Mark("clean", dataClean)
 
         ## Transform
-        dataTransform = dataClean.copy()
-        dataTransform["Date"] = pd.to_datetime(dataTransform["Date"])
-        dataTransform         = dataTransform.set_index("Date")
-        dataTransform.loc[dataTransform["Salmon_Escapes_Rep_Escaped"] == "E:10 - 100", "Salmon_Escapes_Rep_Escaped"] = "55"
-        dataTransform["Salmon_Escapes_Rep_Escaped"] = (
-                                dataTransform["Salmon_Escapes_Rep_Escaped"]
-                                .astype(str)
-                                .fillna("0")
-                                .str.replace("E:", "", regex=False)
-                                )
-        dataTransform["Salmon_Escapes_Rep_Escaped"] = pd.to_numeric(dataTransform["Salmon_Escapes_Rep_Escaped"], errors="coerce")
-        dataTransform        = dataTransform.resample("W-MON").agg({
-                              "Salmon_Escapes_Rep_Escaped" : "sum",
-                              "Salmon_Escapes_Avg_Wt_Grams": "mean",
-                              "Salmon_Escapes_Recapture"   : "sum"
-                              })
-        
-        dataTransform          = dataTransform.reset_index()
-        _colNames              = ["Date", "Salmon_Escapes_Rep_Escaped_Weekly", "Salmon_Escapes_Avg_Wt_Grams_Weekly", "Salmon_Escapes_Recapture_Weekly" ]
-        dataTransform.columns  = _colNames
-        dataTransform["Year"]  = dataTransform["Date"].dt.isocalendar().year
-        dataTransform["Week"]  = dataTransform["Date"].dt.isocalendar().week
-        dataTransform["Month"] = dataTransform["Date"].dt.month
-        dataTransform          = dataTransform.drop(columns = ["Date"])
-        dataTransform          = dataTransform[["Year", "Week", "Month"]
-                                       + list(dataTransform.columns.drop(["Year", "Week", "Month"]))]
-        dataTransform          = dataTransform.astype({
-                                 "Year": "int64",
-                                 "Week": "int64",
-                                 "Month": "int64",
-                                 "Salmon_Escapes_Rep_Escaped_Weekly" : "float64",
-                                 "Salmon_Escapes_Avg_Wt_Grams_Weekly": "float64",
-                                 "Salmon_Escapes_Recapture_Weekly"   : "float64"
-        })
+        dataTransform = self._escapesWeekly(dataClean)
+        _track.Mark("transform", dataTransform)
+
+        return dataTransform
+
+    ##
+    #  Aggregates escape events to weekly totals, in weeks ending on Monday
+    #  as resample("W-MON") labels them, through integer week codes
+    #  @param data clean escape events, Date as datetime64
+    #  @return weekly reported escapes (sum), average weight (mean) and
+    #          recaptures (sum), from the first to the last event week
+    #
+    @classmethod
+    def _escapesWeekly(cls, data):
+
+        ## Estimates are parsed once per distinct value
+        _values, _uniques = pd.factorize(data["Salmon_Escapes_Rep_Escaped"], use_na_sentinel = False)
+        _parts    = pd.Series(_uniques.astype(str)).str.extract(cls.ESCAPE_ESTIMATE)
+        _low      = pd.to_numeric(_parts[0]).to_numpy("float64")
+        _high     = pd.to_numeric(_parts[1]).to_numpy("float64")
+        _reported = np.where(np.isnan(_high), _low, (_low + _high) / 2)[_values]
+
+        _dates    = data["Date"].to_numpy("datetime64[D]")
+        _valid    = ~np.isnat(_dates)
+        _days     = _dates[_valid].astype("int64")
+
+        if len(_days) == 0:
+            _columns = ["Year", "Week", "Month", "Salmon_Escapes_Rep_Escaped_Weekly",
+                        "Salmon_Escapes_Avg_Wt_Grams_Weekly", "Salmon_Escapes_Recapture_Weekly"]
+            return pd.DataFrame({col: pd.Series(dtype = "int64" if i < 3 else "float64")
+                                 for i, col in enumerate(_columns)})
+
+        ## Week ending Monday of each event, Monday being day (days + 3) % 7 == 0
+        _label = _days + (7 - (_days + 3) % 7) % 7
+        _first = _label.min()
+        _codes = (_label - _first) // 7
+        _weeks = _codes.max() + 1
+
+        def _sum(values):
+            values = values[_valid]
+            return np.bincount(_codes, weights = np.where(np.isnan(values), 0, values), minlength = _weeks)
+
+        _weight  = data["Salmon_Escapes_Avg_Wt_Grams"].to_numpy("float64")
+        _count   = np.bincount(_codes, weights = ~np.isnan(_weight[_valid]), minlength = _weeks)
+
+        with np.errstate(invalid = "ignore", divide = "ignore"):
+            _mean = np.where(_count > 0, _sum(_weight) / _count, np.nan)
+
+        _calendar  = IsoCalendar.Weekly()
+        _positions = _calendar.Position((_first + 7 * np.arange(_weeks)).astype("datetime64[D]"))
+
+        dataTransform = pd.DataFrame({
+                        "Year"                              : _calendar.year[_positions],
+                        "Week"                              : _calendar.week[_positions],
+                        "Month"                             : _calendar.month[_positions],
+                        "Salmon_Escapes_Rep_Escaped_Weekly" : _sum(_reported),
+                        "Salmon_Escapes_Avg_Wt_Grams_Weekly": _mean,
+                        "Salmon_Escapes_Recapture_Weekly"   : _sum(data["Salmon_Escapes_Recapture"].to_numpy("float64"))
+                        })
 
         return dataTransform
 
@@ -285,45 +518,26 @@ class DataLoader:
     #  @dataset SSB Norwegian CPI
     #  @return Monthly or Annual CPI in percentage (%)
     #
+    @cached("CPI_NORWAY")
     def CPINorway(self):
 
         ## Clean
         _fileName      = self.CPI_NORWAY
-        _data          = pd.read_excel(_fileName)
+        _track         = self._track("CPINorway")
+        _data          = self._readExcel(_fileName)
+        _track.Mark("read", _data)
+
         _data          = _data[:-2]
         _data          = _data.iloc[::-1]
 
         _dataM         = _data.drop(columns = "Årsgj.snitt2")
-        _months        = ["01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12"]
-        _dataM.columns = ["Year"] + _months
-
-        _years  = _dataM["Year"].values.tolist()
-        _dates  = []
-            
-        for i in _years:
-            for j in _months:
-                _dates.append(f"{i}-{j}-01")
 
-        _values = _dataM[_months].to_numpy().ravel().tolist()
-
-        _monthlyData = {"Date"       : _dates,
-                           "CPI_Norway_Monthly": _values}
-
-        dataClean         = pd.DataFrame(_monthlyData)
-        dataClean["Date"] = pd.to_datetime(dataClean["Date"], format = "%Y-%m-%d")
+        dataClean = SsbTable.YearMonth(_dataM.iloc[:, 0], _dataM.iloc[:, 1:], "CPI_Norway_Monthly")
+        _track.Mark("clean", dataClean)
 
         ## Transform
-        dataTransform          = dataClean.copy()
-        dataTransform["Year"]  = dataTransform["Date"].dt.year
-        dataTransform["Month"] = dataTransform["Date"].dt.month
-        dataTransform  = dataTransform.drop(columns = ["Date"])
-        dataTransform  = dataTransform[["Year", "Month"] 
-                         + list(dataTransform.columns.drop(["Year", "Month"]))]
-        dataTransform  = dataTransform.astype({
-                        "Year"               : "int64",
-                        "Month"              : "int64",
-                        "CPI_Norway_Monthly" : "float64",
-                        })
+        dataTransform = dataClean
+        _track.Mark("transform", dataTransform)
         
         return dataTransform
 
@@ -333,16 +547,21 @@ class DataLoader:
     #  @dataset from bloomberg ticker CP12EAYY, source Eurostat
     #  @return  monthly  index of consumer prices based on meat
     #
+    @cached("PROTEIN_CPI_MEAT")
     def ProteinCPIMeat(self):
         
         ## Clean
         _fileName         = self.PROTEIN_CPI_MEAT
-        _data             = pd.read_excel(_fileName, header = 0)
+        _track            = self._track("ProteinCPIMeat")
+        _data             = self._readExcel(_fileName, header = 0)
+        _track.Mark("read", _data)
+
         dataClean         = _data.copy()
         dataClean["Date"] = pd.to_datetime(dataClean["Date"], format = "%Y-%m-%d")
         dataClean         = dataClean.sort_values("Date", ascending=True)
         dataClean         = dataClean.rename(columns = {"Last Price" : "Protein_CPI_Meat_Monthly"})
         dataClean         = dataClean.reset_index(drop = True)
+        _track.Mark("clean", dataClean)
 
         ## Transform
         dataTransform          = dataClean.copy()
@@ -356,6 +575,7 @@ class DataLoader:
                                 "Month"                  : "int64",
                                 "Protein_CPI_Meat_Monthly": "float64"
                                 })
+        _track.Mark("transform", dataTransform)
 
         return dataTransform
     
@@ -490,36 +710,87 @@ class DataLoader:
             "Equity_SALMAR_NOK_Weekly"
         )
 
+    ##
+    #  Loads several Bloomberg-style files into one wide weekly frame. Files
+    #  sharing their dates are converted to weeks in a single pass
+    #  @param files dictionary of file path to output column, the shipped
+    #               BLOOMBERG_SOURCES when None
+    #  @return weekly last price of every file, one column per file, on the
+    #          weeks from the first to the last week of any file
+    #
+    def WeeklyBatch(self, files = None):
+
+        _files  = files or {getattr(self, self.SOURCE_FILES[name]): self.SOURCE_COLUMNS[name][0]
+                            for name in self.BLOOMBERG_SOURCES}
+        _track  = self._track("WeeklyBatch")
+        _groups = {}
+
+        ## Clean
+        for _fileName, _column in _files.items():
+            _data  = self._readExcel(_fileName, header = 0)
+            _dates = pd.to_datetime(_data["Date"], format = "%Y-%m-%d").to_numpy("datetime64[D]")
+
+            _group = _groups.setdefault(_dates.tobytes(), (_dates, [], []))
+            _group[1].append(_column)
+            _group[2].append(_data["Last Price"].to_numpy("float64"))
+
+        _track.Mark("read")
+
+        ## Transform
+        _weekly = []
+
+        for _dates, _columns, _values in _groups.values():
+            _positions, _last = self._weeklyLast(_dates, np.column_stack(_values))
+            _weekly.append((_positions, _columns, _last))
+
+        _track.Mark("resample")
+
+        ## Files without any dated row add an all-NaN column
+        _bounds    = [(_rows[0], _rows[-1]) for _rows, _, _ in _weekly if len(_rows)]
+        _first     = min((_start for _start, _ in _bounds), default = 0)
+        _positions = np.arange(_first, max((_end for _, _end in _bounds), default = -1) + 1)
+        _matrix    = np.full((len(_positions), len(_files)), np.nan)
+        _order     = {_column: i for i, _column in enumerate(_files.values())}
+
+        for _rows, _columns, _last in _weekly:
+            _matrix[np.ix_(_rows - _first, [_order[_column] for _column in _columns])] = _last
+
+        _calendar     = IsoCalendar.Weekly()
+        dataTransform = pd.DataFrame(_matrix, columns = list(_files.values()))
+        dataTransform.insert(0, "Year", _calendar.year[_positions])
+        dataTransform.insert(1, "Week", _calendar.week[_positions])
+        dataTransform.insert(2, "Month", _calendar.month[_positions])
+        _track.Mark("transform", dataTransform)
+
+        return dataTransform
+
     ##
     #  Generic loader for Bloomberg-style time series
     #  Converts daily data to weekly frequency aligned to Monday
     #
+    @cached()
     def _loadWeekly(self, fileName, columnName):
 
         ## Clean
-        _data = pd.read_excel(fileName, header=0)
+        _track = self._track(columnName)
+        _data  = self._readExcel(fileName, header=0)
+        _track.Mark("read", _data)
 
         dataClean = _data.copy()
         dataClean["Date"] = pd.to_datetime(dataClean["Date"], format="%Y-%m-%d")
-        dataClean = dataClean.sort_values("Date", ascending=True)
         dataClean = dataClean.rename(columns={"Last Price": columnName})
+        _track.Mark("clean", dataClean)
 
         ## Transform
-        dataTransform = (
-            dataClean
-            .set_index("Date")
-            .resample("W-MON")
-            .last()
-            .reset_index()
-        )
+        _columns            = list(dataClean.columns.drop("Date"))
+        _positions, _weekly = self._weeklyLast(dataClean["Date"], dataClean[_columns].to_numpy("float64"))
+        _track.Mark("resample", _weekly)
 
-        dataTransform["Year"]  = dataTransform["Date"].dt.isocalendar().year
-        dataTransform["Week"]  = dataTransform["Date"].dt.isocalendar().week
-        dataTransform["Month"] = dataTransform["Date"].dt.month
-        dataTransform          = dataTransform[["Year", "Week", "Month"]
-                                       + list(dataTransform.columns.drop(["Year", "Week", "Month"]))]
-
-        dataTransform = dataTransform.drop(columns=["Date"])
+        _calendar     = IsoCalendar.Weekly()
+        dataTransform = pd.DataFrame(_weekly, columns = _columns)
+        dataTransform.insert(0, "Year", _calendar.year[_positions])
+        dataTransform.insert(1, "Week", _calendar.week[_positions])
+        dataTransform.insert(2, "Month", _calendar.month[_positions])
 
         dataTransform = dataTransform.astype({
             "Year": "int64",
@@ -527,226 +798,825 @@ class DataLoader:
             "Month": "int64",
             columnName: "float64"
         })
+        _track.Mark("transform", dataTransform)
 
         return dataTransform
 
+    ##
+    #  Last valid observation of each series per week ending on Monday, as
+    #  resample("W-MON").last() returns it. Week boundaries are found by
+    #  binary search on the sorted days, once for every series sharing the
+    #  dates, and the last valid row of each week by binary search on the
+    #  rows holding values. The sort is skipped for sorted input and
+    #  replaced by a reversal for strictly descending input. Rows with a
+    #  NaT date are dropped
+    #  @param dates  datetime64 array or Series, one per row
+    #  @param values float array of shape (rows, series)
+    #  @return tuple (week ordinals of the shared calendar, array of shape
+    #          (weeks, series)), from the first to the last week observed,
+    #          both empty when no row has a date
+    #
+    @staticmethod
+    def _weeklyLast(dates, values):
+
+        _dates  = np.asarray(dates, dtype = "datetime64[D]")
+        _values = np.asarray(values, dtype = "float64")
+        _values = _values.reshape(len(_dates), 1 if _values.ndim == 1 else _values.shape[1])
+
+        ## Rows without a date, such as trailing blank rows of an export, are dropped
+        _valid  = ~np.isnat(_dates)
+        _days   = _dates[_valid].astype("int64")
+        _values = _values[_valid]
+
+        if len(_days) == 0:
+            return np.empty(0, dtype = "int64"), np.empty((0, _values.shape[1]))
+
+        _steps = np.diff(_days)
+
+        ## Bloomberg exports come newest first, reversed without sorting
+        if len(_steps) and (_steps < 0).all():
+            _days   = _days[::-1]
+            _values = _values[::-1]
+        elif (_steps < 0).any():
+            _order  = np.argsort(_days, kind = "stable")
+            _days   = _days[_order]
+            _values = _values[_order]
+
+        ## Monday closing each week, Monday being day (days + 3) % 7 == 0
+        _first   = _days[0] + (7 - (_days[0] + 3) % 7) % 7
+        _last    = _days[-1] + (7 - (_days[-1] + 3) % 7) % 7
+        _mondays = np.arange(_first, _last + 1, 7)
+        _end     = np.searchsorted(_days, _mondays, side = "right")
+        _start   = np.concatenate([[0], _end[:-1]])
+
+        _missing = np.isnan(_values)
+        _weekly  = np.full((len(_mondays), _values.shape[1]), np.nan)
+
+        ## Last valid row before each week end, per series
+        for i in range(_values.shape[1]):
+            _valid = np.flatnonzero(~_missing[:, i]) if _missing[:, i].any() else None
+            _last  = _end - 1 if _valid is None else np.searchsorted(_valid, _end) - 1
+            _found = _last >= 0
+            _last[_found] = _last[_found] if _valid is None else _valid[_last[_found]]
+            _found &= _last >= _start
+
+            _weekly[_found, i] = _values[_last[_found], i]
+
+        return IsoCalendar.Weekly().Position(_mondays.astype("datetime64[D]")), _weekly
+
+    ##
+    #  Reads a workbook with the engine configured for the file, falling
+    #  back to pandas' default engine when it is missing or fails. The
+    #  engine used is recorded in self.engines
+    #  @param fileName xls or xlsx workbook
+    #  @param kwargs   arguments of pd.read_excel
+    #  @return dataframe, or dictionary of dataframes for several sheets
+    #
+    def _readExcel(self, fileName, **kwargs):
+
+        _engine = self._engine(fileName)
+
+        try:
+            _data = pd.read_excel(fileName, engine = _engine, **kwargs)
+        except Exception as error:
+            if _engine is None:
+                raise
+
+            logging.getLogger("data_loader").warning("%s engine failed on %s, using the default engine: %s",
+                                                     _engine, fileName, error)
+            _engine = None
+            _data   = pd.read_excel(fileName, **kwargs)
+
+        self.engines[fileName] = _engine or "default"
+
+        if self.checkEngine and _engine is not None:
+            _default = pd.read_excel(fileName, **kwargs)
+            _sheets  = _data if isinstance(_data, dict) else {None: _data}
+            _others  = _default if isinstance(_default, dict) else {None: _default}
+
+            if _sheets.keys() != _others.keys() or not all(_sheets[key].equals(_others[key]) for key in _sheets):
+                raise ValueError(f"{_engine} and the default engine read {fileName} differently")
+
+        return _data
+
+    ##
+    #  Engine configured for a file
+    #  @param fileName workbook path
+    #  @return engine name, None for pandas' default
+    #
+    def _engine(self, fileName):
+
+        _engine = self._configuredEngine(fileName)
+
+        if _engine == "auto":
+            return "calamine" if self.CALAMINE else None
+
+        return _engine
+
+    ##
+    #  Engine setting of a file before "auto" is resolved
+    #  @param fileName workbook path
+    #  @return "auto", or one of ENGINES
+    #
+    def _configuredEngine(self, fileName):
+
+        _engine = self.engine
+
+        if isinstance(_engine, dict):
+            _names   = {os.path.abspath(getattr(self, attr)): name for name, attr in self.SOURCE_FILES.items()}
+            _path    = os.path.abspath(fileName)
+            _keys    = [key for key in _engine if key == _names.get(_path) or os.path.abspath(key) == _path]
+            _engine  = _engine[_keys[0]] if _keys else "auto"
+
+        if _engine != "auto" and _engine not in self.ENGINES:
+            raise ValueError(f"Unknown Excel engine: {_engine}")
+
+        return _engine
+
+    ##
+    #  Streams the rows of a worksheet without loading it whole, through
+    #  openpyxl in read-only mode. python-calamine, which parses the whole
+    #  sheet before handing rows over, is only used when it is configured
+    #  for the file explicitly, "auto" keeping the stream; it falls back to
+    #  openpyxl when it is missing or fails. The engine used is recorded in
+    #  self.engines
+    #  @param fileName  xlsx workbook
+    #  @param sheetName worksheet to read
+    #  @param skiprows  number of rows above the header row
+    #  @param columns   header names of the columns to yield
+    #  @return generator of tuples with the selected cell values
+    #
+    def _iterSheet(self, fileName, sheetName, skiprows, columns):
+
+        if self._configuredEngine(fileName) != "calamine":
+            self.engines[fileName] = "openpyxl"
+            yield from self._iterSheetOpenpyxl(fileName, sheetName, skiprows, columns)
+            return
+
+        try:
+            _rows = list(self._iterSheetCalamine(fileName, sheetName, skiprows, columns))
+        except Exception as error:
+            logging.getLogger("data_loader").warning("calamine engine failed on %s, using openpyxl: %s",
+                                                     fileName, error)
+            self.engines[fileName] = "openpyxl"
+            yield from self._iterSheetOpenpyxl(fileName, sheetName, skiprows, columns)
+            return
+
+        self.engines[fileName] = "calamine"
+
+        if self.checkEngine and _rows != list(self._iterSheetOpenpyxl(fileName, sheetName, skiprows, columns)):
+            raise ValueError(f"calamine and openpyxl read {fileName} differently")
+
+        yield from _rows
+
+    ##
+    #  Rows of a worksheet through openpyxl in read-only mode, one at a time
+    #
+    def _iterSheetOpenpyxl(self, fileName, sheetName, skiprows, columns):
+
+        _workbook = openpyxl.load_workbook(fileName, read_only = True, data_only = True)
+
+        try:
+            _rows    = _workbook[sheetName].iter_rows(min_row = skiprows + 1, values_only = True)
+            _header  = list(next(_rows))
+            _indices = [_header.index(col) for col in columns]
+
+            for _row in _rows:
+                yield tuple(_row[i] if i < len(_row) else None for i in _indices)
+        finally:
+            _workbook.close()
+
+    ##
+    #  Rows of a worksheet through python-calamine, which parses the sheet
+    #  natively before handing the rows over, empty cells as None
+    #
+    def _iterSheetCalamine(self, fileName, sheetName, skiprows, columns):
+
+        from python_calamine import CalamineWorkbook
+
+        with CalamineWorkbook.from_path(fileName) as _workbook:
+            _rows    = _workbook.get_sheet_by_name(sheetName).iter_rows()
+
+            for _ in range(skiprows):
+                next(_rows)
+
+            _header  = list(next(_rows))
+            _indices = [_header.index(col) for col in columns]
+
+            for _row in _rows:
+                yield tuple(_row[i] if i < len(_row) and _row[i] != "" else None for i in _indices)
+
+    ##
+    #   Runs the loaders, serially or fanned out over a worker pool
+    #   @param names    loader method names
+    #   @param parallel runs the loaders concurrently
+    #   @param workers  number of workers, defaults to one per loader or CPU
+    #   @param executor "process" or "thread" pool used when parallel
+    #   @return dictionary of loader name to dataset, in the order of names
+    #
+    def _loadSources(self, names, parallel = False, workers = None, executor = "process"):
+
+        names = list(names)
+
+        if not parallel or len(names) < 2:
+            return {name: _runLoader(self, name)[0] for name in names}
+
+        _pools   = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+        _workers = workers or min(len(names), os.cpu_count() or 1)
+
+        ## Largest files first, so the slowest loader starts right away. Workbooks missing
+        ## on a host running from converted files only count as empty
+        _files = {name: getattr(self, self.SOURCE_FILES[name]) for name in names}
+        _order = sorted(names, key = lambda name: -os.path.getsize(_files[name]) if os.path.exists(_files[name]) else 0)
+
+        with _pools[executor](max_workers = _workers) as _pool:
+            _futures = {name: _pool.submit(_runLoader, self, name, executor == "process") for name in _order}
+            _results = {name: _futures[name].result() for name in names}
+
+        ## Stages recorded in worker processes come back with each dataset
+        if self.instrumentation is not None:
+            for name in names:
+                self.instrumentation.records.extend(_results[name][1])
+
+        return {name: _results[name][0] for name in names}
+
+    ##
+    #  Tracker of the stages of a loader, a no-op one without instrumentation
+    #  @param loader label of the loader
+    #  @return tracker whose Mark() closes each stage
+    #
+    def _track(self, loader):
+
+        if self.instrumentation is None:
+            return NULL_TRACKER
+
+        return self.instrumentation.Track(loader)
+
     ##
     #   Merge everything
     #   @datasets retrieved from various providers in weekly and monthly conventions
+    #   @param parallel loads the sources concurrently before merging
+    #   @param workers  number of workers, defaults to one per source or CPU
+    #   @param executor "process" or "thread" pool used when parallel
+    #   @param compact  returns the panel in the reduced dtypes of Compact()
+    #   @param disaggregate None repeats monthly values over their weeks, or one
+    #                       of TemporalDisaggregation.METHODS to convert the
+    #                       monthly columns into weekly series
+    #   @param cutoff   last week kept in the panel, "default" for the CUTOFF
+    #                   attribute, None keeps every Fish Pool week
     #   @return weekly observations per feature, containing full information
     #
-    def Data(self):
+    def Data(self, parallel = False, workers = None, executor = "process", compact = False, disaggregate = None,
+             cutoff = "default"):
 
         ## Load datasets
-        _data        = self.SalmonPriceFishPool()
-
-        _salmonsb    = self.SalmonPriceSSB()
-        _salmonbb    = self.SalmonPriceBloomberg()
-        _escapes     = self.SalmonEscapes()
-
-        _broiler     = self.ProteinBroilerPrice()
-        _pig         = self.ProteinPigPrice()
-
-        _eurnok      = self.EURNOK()
-        _usdnok      = self.USDNOK()
-
-        _brent       = self.CommodityBrentPrice()
-        _wheat       = self.CommodityWheatPrice()
-        _soybean     = self.CommoditySoybeanPrice()
-        _rapseed     = self.CommodityRapseedPrice()
-
-        _mowi        = self.EquityMOWIPrice()
-        _salmar      = self.EquitySALMARPrice()
-
-        _cpi         = self.CPINorway()
-        _cpimeat     = self.ProteinCPIMeat()
-        _biomass     = self.SalmonBiomass()
-        _exports     = self.SalmonExport()
-
-        ## Create Date from FishPool
-        _data["Date"] = pd.to_datetime(
-            _data["Year"].astype(str)
-            + "-W"
-            + _data["Week"].astype(str).str.zfill(2)
-            + "-1",
-            format="%G-W%V-%u"
-        )
+        _sources = self._loadSources(self.SOURCE_FILES, parallel, workers, executor)
 
-        ## Create continuous weekly calendar
-        start = _data["Date"].min()
-        end   = _data["Date"].max()
+        data = self._merge(_sources, cutoff = cutoff)
 
-        calendar = pd.DataFrame({
-            "Date": pd.date_range(start=start, end=end, freq="W-MON")
-        })
+        if disaggregate is not None:
+            data = self.Disaggregate(data, disaggregate)
 
-        calendar["Year"]  = calendar["Date"].dt.isocalendar().year
-        calendar["Week"]  = calendar["Date"].dt.isocalendar().week
-        calendar["Month"] = calendar["Date"].dt.month
+        return self.Compact(data) if compact else data
 
-        ## Base dataset
-        data = calendar.merge(
-            _data.drop(columns=["Date"], errors="ignore"),
-            on=["Year","Week","Month"],
-            how="left"
-        )
+    ##
+    #   Aligns every source on the weekly calendar and assembles the panel
+    #   with a single concatenation
+    #   @param sources dictionary of loader name to dataset, the Fish Pool
+    #                  prices are required, any other source is optional
+    #   @param start   first Monday of the calendar, the Fish Pool start when None
+    #   @param cutoff  last week kept, "default" for the CUTOFF attribute,
+    #                  None for the last Fish Pool week
+    #   @return weekly observations per feature, as returned by Data()
+    #
+    def _merge(self, sources, start = None, cutoff = "default"):
 
-        ## Weekly merges (aligned by Date)
-        for w in [
-            _salmonsb, _salmonbb, _escapes,
-            _broiler, _pig,
-            _eurnok, _usdnok,
-            _brent, _wheat, _soybean, _rapseed,
-            _mowi, _salmar
-        ]:
-
-            w = w.copy()
-
-            w["Date"] = pd.to_datetime(
-                w["Year"].astype(str)
-                + "-W"
-                + w["Week"].astype(str).str.zfill(2)
-                + "-1",
-                format="%G-W%V-%u"
-            )
+        _track = self._track("Data")
+        _data  = sources["SalmonPriceFishPool"]
 
-            w = w.drop(columns=["Year","Week","Month"], errors="ignore")
+        ## Continuous weekly calendar over the Fish Pool weeks
+        _calendar  = IsoCalendar.Weekly()
+        _ordinals  = _calendar.WeekPosition(_data["Year"], _data["Week"])
+        _first     = _ordinals.min() if start is None else max(_ordinals.min(), _calendar.Position([start])[0])
+        _positions = np.arange(_first, _ordinals.max() + 1)
 
-            data = data.merge(
-                w,
-                on="Date",
-                how="left"
-            )
+        calendar = _calendar.Frame(_positions)
+        _keys    = self._calendarKeys(calendar)
+        _track.Mark("calendar", calendar)
 
-        ## Monthly merges
-        for m in [_cpi, _cpimeat, _biomass, _exports]:
+        ## Base dataset, then the weekly and monthly sources, in panel column order
+        _blocks = [calendar] + [self._sourceBlock(name, sources[name], _positions, *_keys)
+                                for name in ["SalmonPriceFishPool"] + self.WEEKLY_SOURCES + self.MONTHLY_SOURCES
+                                if name in sources]
+        _track.Mark("align")
 
-            m = m.groupby(["Year","Month"], as_index=False).first()
+        data = pd.concat([block.set_axis(calendar.index) for block in _blocks], axis=1)
+        _track.Mark("concat", data)
 
-            data = data.merge(
-                m,
-                on=["Year","Month"],
-                how="left",
-                validate="many_to_one"
-            )
+        ## Forwards fill only market variables
+        _fillCols = self._fillColumns(data.columns)
 
-        ## Sort dataset
-        data = data.sort_values("Date").reset_index(drop=True)
+        data[_fillCols] = data[_fillCols].ffill()
+        _track.Mark("ffill", data)
 
+        ## Time index
+        data.insert(0, "t", range(len(data)))
 
-        ## Forwards fill only market variables
-        _fillCols = data.columns[
-            data.columns.str.contains(
+        ## Convert Date to weekly period
+        data["Date"] = _calendar.period[_positions]
+        data         = self._applyCutoff(data, cutoff)
+        _track.Mark("finalize", data)
+
+        return data
+
+    ##
+    #   Week and month keys of calendar rows
+    #   @param calendar dataframe with Year, Week and Month columns
+    #   @return tuple of MultiIndex (Year/Week/Month, Year/Month)
+    #
+    @staticmethod
+    def _calendarKeys(calendar):
+
+        return (pd.MultiIndex.from_arrays([calendar[col].to_numpy("int64") for col in ["Year", "Week", "Month"]]),
+                pd.MultiIndex.from_arrays([calendar[col].to_numpy("int64") for col in ["Year", "Month"]]))
+
+    ##
+    #   Aligns one source on calendar rows: the Fish Pool prices by
+    #   Year/Week/Month, weekly sources by week ordinal and monthly sources
+    #   by Year/Month
+    #   @param name      loader name
+    #   @param source    dataset returned by the loader
+    #   @param positions week ordinals of the calendar rows
+    #   @param weekKeys  Year/Week/Month keys of the calendar rows
+    #   @param monthKeys Year/Month keys of the calendar rows
+    #   @return dataset with one row per calendar row, without key columns
+    #
+    def _sourceBlock(self, name, source, positions, weekKeys, monthKeys):
+
+        if name == "SalmonPriceFishPool":
+            return self._align(source, ["Year", "Week", "Month"], weekKeys)
+
+        if name in self.WEEKLY_SOURCES:
+            return source.drop(columns=["Year","Week","Month"], errors="ignore").set_axis(
+                IsoCalendar.Weekly().WeekPosition(source["Year"], source["Week"])).reindex(positions)
+
+        m = source.groupby(["Year","Month"], as_index=False).first()
+
+        return self._align(m, ["Year", "Month"], monthKeys)
+
+    ##
+    #   Converts the monthly columns of the panel into weekly series. The
+    #   solved weights and the previous panel are kept per method, so that a
+    #   panel extended by new months only solves its tail again
+    #   @param data   dataframe returned by Data()
+    #   @param method one of TemporalDisaggregation.METHODS
+    #   @return copy of data with weekly monthly columns, the MONTHLY_FLOWS
+    #           summing to each month and the others averaging to it
+    #
+    def Disaggregate(self, data, method = "denton"):
+
+        _track = self._track("Disaggregate")
+
+        if method not in self.disaggregation:
+            self.disaggregation[method] = TemporalDisaggregation(method)
+
+        data = self.disaggregation[method].Panel(data, flows = self.MONTHLY_FLOWS)
+        _track.Mark(method, data)
+
+        return data
+
+    ##
+    #   Stores the panel in smaller dtypes: calendar columns as the smallest
+    #   integer type holding them, and price columns as float32 when every
+    #   value rounds back to the same figure at the decimals it is quoted
+    #   with. The other float columns, volumes and values that float32
+    #   would shift by whole units, stay float64. The float32 columns are
+    #   consolidated into one contiguous block
+    #   @param data     dataframe returned by Data()
+    #   @param decimals dictionary of column to its quoted decimals, the
+    #                   float32 candidates, PRICE_DECIMALS when None
+    #   @return compact dataframe, with a report of dtypes, errors and bytes
+    #           saved in attrs["compact"]
+    #
+    def Compact(self, data, decimals = None):
+
+        _decimals = self.PRICE_DECIMALS if decimals is None else decimals
+        _columns  = {}
+        _report   = {}
+
+        for col in data.columns:
+            _series = data[col]
+
+            if col in ["t", "Year", "Week", "Month"]:
+                _values = _series.to_numpy("int64")
+                _dtype  = np.result_type(np.min_scalar_type(-max(abs(_values.min()), abs(_values.max()), 1)), np.int8)
+                _columns[col] = _values.astype(_dtype)
+                _report[col]  = {"dtype": str(_dtype), "maxAbsError": 0.0}
+
+            elif _series.dtype == "float64" and col in _decimals:
+                _values = _series.to_numpy()
+                _single = _values.astype("float32")
+                _back   = _single.astype("float64")
+                _error  = np.nanmax(np.abs(_back - _values), initial = 0.0)
+                _keep   = np.array_equal(np.round(_back, _decimals[col]), np.round(_values, _decimals[col]),
+                                         equal_nan = True)
+                _columns[col] = _single if _keep else _values
+                _report[col]  = {"dtype": "float32" if _keep else "float64", "maxAbsError": float(_error)}
+
+            else:
+                _columns[col] = _series
+                _report[col]  = {"dtype": str(_series.dtype), "maxAbsError": 0.0}
+
+        compact = pd.DataFrame(_columns, index = data.index).copy()
+
+        _before = int(data.memory_usage(deep = True).sum())
+        _after  = int(compact.memory_usage(deep = True).sum())
+
+        compact.attrs["compact"] = {"bytesBefore": _before,
+                                    "bytesAfter" : _after,
+                                    "bytesSaved" : _before - _after,
+                                    "columns"    : _report}
+
+        return compact
+
+    ##
+    #   Materialises the merged dataset once as a memory-mapped matrix that
+    #   any number of processes can map with LoadMatrix()
+    #   @param path file path without extension, .npy and .json are written
+    #   @param data dataframe returned by Data(), loaded when None
+    #   @return ModelMatrix over the written file
+    #
+    def ExportMatrix(self, path, data = None):
+
+        return ModelMatrix.Export(self.Data() if data is None else data, path)
+
+    ##
+    #   Maps a matrix written by ExportMatrix(), read-only and zero-copy
+    #   @param path file path without extension
+    #   @return ModelMatrix over the mapped file
+    #
+    @staticmethod
+    def LoadMatrix(path):
+
+        return ModelMatrix.Load(path)
+
+    ##
+    #   Lazy view of the merged dataset, loading only the sources behind
+    #   the requested columns
+    #   @return LazyData over this loader
+    #
+    def Lazy(self):
+
+        return LazyData(self)
+
+    ##
+    #   Extends a panel built by Data() after some sources received new data,
+    #   re-deriving only the weeks from the first one the new data affects.
+    #   Only the changed sources are loaded and aligned on the panel rows;
+    #   as every column comes from one source, the other columns of the
+    #   panel are kept. Unchanged sources are loaded, from the cache, only
+    #   when new Fish Pool weeks extend the calendar, and merged over the
+    #   new weeks alone
+    #   @param data    dataframe previously returned by Data()
+    #   @param changed loader names or source files that changed
+    #   @param cutoff  last week kept, "default" for the CUTOFF attribute,
+    #                  None to append every new Fish Pool week
+    #   @return weekly observations per feature, equal to Data(cutoff = cutoff)
+    #           when the panel was built with a cutoff no earlier than the
+    #           last week of the unchanged sources
+    #
+    def Update(self, data, changed, cutoff = None):
+
+        _track   = self._track("Update")
+        _sources = self._loadSources(self._changedSources(changed))
+        _track.Mark("load")
+
+        _first, _blocks, _extends = self._affectedRows(data, _sources)
+        _track.Mark("compare")
+
+        if _first is None:
+            _sources.update(self._loadSources([name for name in self.SOURCE_FILES if name not in _sources]))
+            return self._merge(_sources, cutoff = cutoff)
+
+        data = data.copy()
+
+        ## Affected weeks of the changed columns
+        for _block in _blocks:
+            data.iloc[_first:, data.columns.get_indexer(_block.columns)] = _block.iloc[_first:].to_numpy()
+
+        ## New weeks, seeding the forward fill with the last panel week
+        if _extends:
+            _sources.update(self._loadSources([name for name in self.SOURCE_FILES if name not in _sources]))
+
+            _calendar = IsoCalendar.Weekly()
+            _start    = _calendar.dates[_calendar.WeekPosition(data["Year"].iloc[-1:], data["Week"].iloc[-1:])[0] + 1]
+            _tail     = self._merge(_sources, start = _start, cutoff = cutoff)
+
+            _fillCols        = self._fillColumns(_tail.columns)
+            _tail[_fillCols] = pd.concat([data[_fillCols].iloc[-1:], _tail[_fillCols]]).ffill().iloc[1:].to_numpy()
+            _tail["t"]       = range(len(data), len(data) + len(_tail))
+            _tail.index      = pd.RangeIndex(len(data), len(data) + len(_tail))
+
+            data = pd.concat([data, _tail])
+            _track.Mark("append", _tail)
+
+        return self._applyCutoff(data, cutoff)
+
+    ##
+    #   Drops the weeks after a cutoff, resolved when called so that setting
+    #   CUTOFF on a loader or subclass applies to every merge
+    #   @param data   dataframe with a weekly Date period column
+    #   @param cutoff last week kept, "default" for the CUTOFF attribute,
+    #                 None keeps every week
+    #   @return dataframe restricted to the weeks up to the cutoff
+    #
+    def _applyCutoff(self, data, cutoff):
+
+        _cutoff = self.CUTOFF if isinstance(cutoff, str) and cutoff == "default" else cutoff
+
+        if _cutoff is None:
+            return data
+
+        return data[data["Date"] <= pd.Period(_cutoff, freq="W")]
+
+    ##
+    #   Aligns the changed sources on the panel rows, forward filled as in
+    #   _merge, and finds the first row whose values differ
+    #   @param data    dataframe previously returned by Data()
+    #   @param sources dictionary of changed loader name to its new dataset
+    #   @return tuple (first affected row, len(data) when none, or None when
+    #           the panel must be merged again; aligned datasets; True when
+    #           new Fish Pool weeks follow the last panel week)
+    #
+    def _affectedRows(self, data, sources):
+
+        if len(data) == 0:
+            return None, [], False
+
+        _calendar  = IsoCalendar.Weekly()
+        _positions = _calendar.WeekPosition(data["Year"], data["Week"])
+        _keys      = self._calendarKeys(data)
+        _first     = len(data)
+        _blocks    = []
+        _extends   = False
+
+        if not np.array_equal(_positions, np.arange(_positions[0], _positions[0] + len(data))):
+            return None, [], False
+
+        for name, source in sources.items():
+            _block = self._sourceBlock(name, source, _positions, *_keys)
+
+            if not set(_block.columns) <= set(data.columns):
+                return None, [], False
+
+            _fillCols         = self._fillColumns(_block.columns)
+            _block[_fillCols] = _block[_fillCols].ffill()
+
+            _old  = data[_block.columns].to_numpy("float64", na_value = np.nan)
+            _new  = _block.to_numpy("float64", na_value = np.nan)
+            _diff = np.flatnonzero(~((_old == _new) | (np.isnan(_old) & np.isnan(_new))).all(axis = 1))
+
+            _first = min(_first, _diff[0]) if len(_diff) else _first
+            _blocks.append(_block)
+
+            if name == "SalmonPriceFishPool":
+                _extends = _calendar.WeekPosition(source["Year"], source["Week"]).max() > _positions[-1]
+
+        return _first, _blocks, _extends
+
+    ##
+    #   Resolves loader names or source file paths to loader names
+    #   @param changed iterable of loader names or file paths
+    #   @return list of loader names, in SOURCE_FILES order
+    #
+    def _changedSources(self, changed):
+
+        _files  = {os.path.abspath(getattr(self, attr)): name for name, attr in self.SOURCE_FILES.items()}
+        _names  = set()
+
+        for item in changed:
+            if item in self.SOURCE_FILES:
+                _names.add(item)
+            elif os.path.abspath(item) in _files:
+                _names.add(_files[os.path.abspath(item)])
+            else:
+                raise ValueError(f"Unknown source: {item}")
+
+        return [name for name in self.SOURCE_FILES if name in _names]
+
+    ##
+    #   Market variables forward filled over missing weeks
+    #   @param columns panel columns
+    #   @return subset of columns to forward fill
+    #
+    @staticmethod
+    def _fillColumns(columns):
+
+        _fillCols = columns[
+            columns.str.contains(
                 "Weekly|Commodity|Equity|EURNOK|USDNOK|Salmon_NOK_kg"
             )
         ]
 
         ## Exclude biomass and escapes
-        _fillCols = _fillCols[
+        return _fillCols[
             ~_fillCols.str.contains("Biomass|Escapes")
         ]
 
-        data[_fillCols] = data[_fillCols].ffill()
-
-        ## Time index
-        data.insert(0, "t", range(len(data)))
-
-        ## Convert Date to weekly period
-        data["Date"] = data["Date"].dt.to_period("W")
+    ##
+    #   Reindexes a dataset on calendar keys, dropping the key columns
+    #   @param data dataset holding the key columns
+    #   @param keys names of the key columns
+    #   @param index MultiIndex of calendar keys, one entry per calendar row
+    #   @return dataset with one row per calendar row
+    #
+    @staticmethod
+    def _align(data, keys, index):
 
-        _cutoff = pd.Period("2025-12-28", freq="W")
+        _index = pd.MultiIndex.from_arrays([data[col].to_numpy("int64") for col in keys])
 
-        data = data[data["Date"] <= _cutoff]
+        return data.drop(columns=keys).set_axis(_index).reindex(index)
 
-        return data
-    
     ##
-    #   Validates merged dataset integrity and data quality
-    #   @param data dataframe returned by Data()
-    #   @return diagnostic output and validation assertions
+    #   Validates merged dataset integrity and data quality. Every check
+    #   runs on one float block of the numeric columns, sorted once per
+    #   column, and the panel is not copied per check
+    #   @param data    dataframe returned by Data()
+    #   @param verbose prints the checks and their tables
+    #   @param strict  raises AssertionError after the checks when any failed
+    #   @return ValidationReport with per-check pass/fail, value and timing
     #
-    def ValidateData(self, data):
+    def ValidateData(self, data, verbose = True, strict = False):
+
+        report = ValidationReport()
+        _clock = time.perf_counter()
+
+        def _add(check, passed, value, detail = None):
+            nonlocal _clock
+            _now = time.perf_counter()
+            report.Add(check, passed, value, _now - _clock, detail)
+            _clock = _now
 
         ## Structural checks
-        print("\n--- DATASET STRUCTURE ---")
-        print("Rows   :", len(data))
-        print("Cols   :", len(data.columns))
+        _missingKeys = [col for col in ["Year", "Week", "Month", "Date"] if col not in data.columns]
+        _add("structure", not _missingKeys, f"{len(data)} rows, {len(data.columns)} columns",
+             _missingKeys or None)
+
+        _dupCols = list(data.columns[data.columns.duplicated()])
+        _add("column duplication", not _dupCols, len(_dupCols), _dupCols or None)
+
+        if _missingKeys:
+            return self._finishReport(report, verbose, strict)
 
-        assert "Year" in data.columns
-        assert "Week" in data.columns
-        assert "Month" in data.columns
-        assert "Date" in data.columns
+        ## Time ordering, key uniqueness and continuity on integer week codes
+        _weeks    = self._weekOrdinals(data["Date"])
+        _steps    = np.diff(_weeks)
+        _add("date ordering", bool((_steps >= 0).all()), "monotonic increasing")
 
-        ## Time ordering
-        print("\n--- TIME ORDER CHECK ---")
+        _yearWeek = np.sort(data["Year"].to_numpy("int64") * 100 + data["Week"].to_numpy("int64"))
+        _dupYW    = int((np.diff(_yearWeek) == 0).sum())
+        _add("duplicate year-week", _dupYW == 0, _dupYW)
 
-        assert data["Date"].is_monotonic_increasing
-        print("Date ordering: OK")
+        _dupD     = int((np.diff(np.sort(_weeks)) == 0).sum())
+        _add("duplicate date", _dupD == 0, _dupD)
 
-        ## Key uniqueness
-        print("\n--- KEY UNIQUENESS ---")
+        _gaps, _counts = np.unique(_steps, return_counts = True)
+        _add("week continuity", None, f"{int(_counts[_gaps == 1].sum())} of {len(_steps)} steps of one week",
+             pd.Series(_counts, index = pd.Index(_gaps, name = "weeks"), name = "count")
+             .sort_values(ascending = False))
 
-        _dupYW = data.duplicated(["Year","Week"]).sum()
-        _dupD  = data["Date"].duplicated().sum()
+        ## One float block of the numeric columns, sorted once per column
+        _numeric = data.columns[[pd.api.types.is_numeric_dtype(t) for t in data.dtypes]]
+        _block   = data[_numeric].to_numpy("float64", na_value = np.nan)
+        _nans    = np.isnan(_block)
+        _count   = len(_block) - _nans.sum(axis = 0)
+        _order   = np.argsort(_block, axis = 0, kind = "stable")
+        _sorted  = np.take_along_axis(_block, _order, axis = 0)
 
-        print("Duplicate Year-Week :", _dupYW)
-        print("Duplicate Date      :", _dupD)
+        _missing = pd.Series(100 * (1 - _count / max(len(_block), 1)), index = _numeric).sort_values(ascending = False)
+        _add("missing values", None, f"{int((_missing > 0).sum())} columns with missing values",
+             _missing[_missing > 0])
 
-        assert _dupYW == 0
-        assert _dupD  == 0
+        _monthly = np.flatnonzero(_numeric.str.contains("_Monthly"))
+        _unique  = self._monthlyUnique(data, _sorted[:, _monthly], _order[:, _monthly]) if len(_monthly) else 0
+        _add("monthly merge consistency", _unique <= 1, f"max {_unique} unique values per month")
 
-        ## Missing values
-        print("\n--- MISSING VALUES (%) ---")
+        _add("numeric summary", None, f"{len(_numeric)} numeric columns", self._summary(_block, _sorted, _nans, _count, _numeric))
 
-        _missing = (data.isna().mean()*100).sort_values(ascending=False)
+        with np.errstate(invalid = "ignore"):
+            _extreme = pd.Series((np.abs(_block) > 1e6).sum(axis = 0), index = _numeric)
+        _add("extreme values", None, f"{int((_extreme > 0).sum())} columns above 1e6", _extreme[_extreme > 0])
 
-        print(_missing[_missing > 0].head(20))
+        return self._finishReport(report, verbose, strict)
 
-        ## Monthly merge consistency
-        print("\n--- MONTHLY MERGE CONSISTENCY ---")
+    @staticmethod
+    def _finishReport(report, verbose, strict):
 
-        _monthlyCols = data.filter(like="_Monthly").columns
+        if verbose:
+            report.Print()
 
-        if len(_monthlyCols) > 0:
+        if strict:
+            report.Raise()
 
-            _check = data.groupby(["Year","Month"])[_monthlyCols].nunique()
+        return report
 
-            _max = _check.max().max()
+    ##
+    #   Integer week codes of a Date column, periods or datetimes
+    #
+    @staticmethod
+    def _weekOrdinals(dates):
+
+        if isinstance(dates.dtype, pd.PeriodDtype):
+            return dates.array.asi8
 
-            print("Max unique values per month:", _max)
+        _days = dates.to_numpy("datetime64[D]").astype("int64")
 
-            assert _max <= 1
+        return (_days - (_days + 3) % 7) // 7
 
-            print("Monthly merge consistency: OK")
+    ##
+    #   Largest number of distinct values a monthly column takes within one
+    #   Year/Month, from the per-column sort: rows are re-sorted by month
+    #   code then value rank, and a value counts when it differs from the
+    #   previous row of its month. Missing values are not counted, as in
+    #   groupby().nunique()
+    #   @param data   panel holding Year and Month
+    #   @param sorted column values sorted ascending, missing values last
+    #   @param order  row of each sorted value
+    #   @return maximum count over months and columns
+    #
+    @staticmethod
+    def _monthlyUnique(data, sorted, order):
 
-        ## Numeric summary
-        print("\n--- NUMERIC SUMMARY ---")
+        _rows   = len(order)
 
-        _numeric = data.select_dtypes(include="number")
+        if _rows == 0:
+            return 0
 
-        print(_numeric.describe().T.head(10))
+        _months = (data["Year"].to_numpy("int64") * 12 + data["Month"].to_numpy("int64"))
+        _codes  = np.unique(_months, return_inverse = True)[1].reshape(-1)
+        _rank   = np.empty_like(order)
 
-        ## Extreme values
-        print("\n--- EXTREME VALUE CHECK ---")
+        np.put_along_axis(_rank, order, np.arange(_rows)[:, None], axis = 0)
 
-        _extreme = (_numeric.abs() > 1e6).sum()
+        _keys   = np.sort(_codes[:, None] * _rows + _rank, axis = 0)
+        _group  = _keys // _rows
+        _values = np.take_along_axis(sorted, _keys % _rows, axis = 0)
+        _valid  = ~np.isnan(_values)
 
-        print(_extreme[_extreme > 0])
+        _new    = _valid.copy()
+        _new[1:] &= (_group[1:] != _group[:-1]) | (_values[1:] != _values[:-1])
 
-        ## Time continuity
-        print("\n--- WEEK CONTINUITY ---")
+        _counts = np.zeros((_codes.max() + 1, order.shape[1]), dtype = "int64")
+        np.add.at(_counts, (_group[_new], np.nonzero(_new)[1]), 1)
+
+        return int(_counts.max()) if _counts.size else 0
+
+    ##
+    #   describe() of the numeric columns from the per-column sort
+    #
+    @staticmethod
+    def _summary(block, sorted, nans, count, columns):
 
-        _weekDiff = data["Date"].diff().dropna()
+        _sum  = np.where(nans, 0.0, block).sum(axis = 0)
 
-        print(_weekDiff.value_counts().head())
+        with np.errstate(invalid = "ignore", divide = "ignore"):
+            _mean = _sum / count
+            _std  = np.sqrt(np.where(nans, 0.0, (block - _mean) ** 2).sum(axis = 0) / (count - 1))
+
+        _stats = {"count": count.astype("float64"), "mean": _mean, "std": np.where(count > 1, _std, np.nan)}
+
+        ## A row of NaN stands in for the sorted values of an empty panel
+        sorted = sorted if len(sorted) else np.full((1, sorted.shape[1]), np.nan)
+
+        for _name, _q in [("min", 0.0), ("25%", 0.25), ("50%", 0.5), ("75%", 0.75), ("max", 1.0)]:
+            _position = _q * np.maximum(count - 1, 0)
+            _low      = np.floor(_position).astype("int64")
+            _high     = np.ceil(_position).astype("int64")
+            _lowValue  = np.take_along_axis(sorted, _low[None, :], axis = 0)[0]
+            _highValue = np.take_along_axis(sorted, _high[None, :], axis = 0)[0]
+            _stats[_name] = np.where(count > 0, _lowValue + (_highValue - _lowValue) * (_position - _low), np.nan)
+
+        return pd.DataFrame(_stats, index = columns)
+
+
+##
+#  Runs a loader, returning the stages it recorded when it ran in a worker
+#  process with its own copy of the instrumentation
+#  @param loader DataLoader
+#  @param name   loader method name
+#  @param worker True when running in a worker process
+#  @return tuple (dataset, list of recorded stages)
+#
+def _runLoader(loader, name, worker = False):
 
-        ## Column duplication
-        print("\n--- COLUMN DUPLICATION ---")
+    _track = loader._track(name)
 
-        _dupCols = data.columns[data.columns.duplicated()]
+    if worker and loader.instrumentation is not None:
+        loader.instrumentation.Clear()
 
-        print("Duplicate columns:", list(_dupCols))
+    data = getattr(loader, name)()
+    _track.Mark("load", data)
 
-        assert len(_dupCols) == 0
+    _records = loader.instrumentation.records if worker and loader.instrumentation is not None else []
 
-        print("\nDATA VALIDATION PASSED")
\ No newline at end of file
+    return data, _records
@@ -0,0 +1,205 @@
+##
+#  This module constructs the FeatureEngineer class
+##
+
+##
+#  Imports libraries needed
+#
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+##
+# This class derives model features from the weekly panel returned by
+# DataLoader.Data(): lags, log returns, rolling statistics and differences
+# against the same ISO week of the previous year. Each feature is computed
+# on the NumPy column, memoized per (column, transform, window) with LRU
+# eviction, and extended incrementally when new weeks are appended.
+#
+class FeatureEngineer:
+
+    TRANSFORMS = ["lag", "logreturn", "mean", "std", "min", "max", "seasonal"]
+
+    ##
+    #  @param data       dataframe returned by DataLoader.Data(), ordered by t
+    #  @param maxEntries number of memoized features kept
+    #
+    def __init__(self, data, maxEntries = 256):
+
+        self.data       = data.reset_index(drop = True)
+        self.maxEntries = maxEntries
+        self._cache     = OrderedDict()
+
+    ##
+    #  Value of a column k weeks earlier
+    #
+    def Lag(self, column, lag = 1):
+
+        return self.Feature(column, "lag", lag)
+
+    ##
+    #  Log return over k weeks
+    #
+    def LogReturn(self, column, lag = 1):
+
+        return self.Feature(column, "logreturn", lag)
+
+    ##
+    #  Rolling statistic over the last window weeks, NaN until the window
+    #  is full or when it holds a missing value, as pandas rolling() does
+    #  @param stat "mean", "std", "min" or "max"
+    #
+    def Rolling(self, column, window, stat = "mean"):
+
+        return self.Feature(column, stat, window)
+
+    ##
+    #  Difference against the same ISO week of the previous year
+    #
+    def SeasonalDiff(self, column):
+
+        return self.Feature(column, "seasonal", 1)
+
+    ##
+    #  Memoized feature
+    #  @param column    panel column
+    #  @param transform one of TRANSFORMS
+    #  @param window    lag or window length in weeks
+    #  @return series aligned with the panel rows
+    #
+    def Feature(self, column, transform, window):
+
+        if transform not in self.TRANSFORMS:
+            raise ValueError(f"Unknown transform: {transform}")
+
+        _key = (column, transform, int(window))
+
+        if _key in self._cache:
+            self._cache.move_to_end(_key)
+        else:
+            _values = self.data[column].to_numpy("float64", na_value = np.nan)
+            self._store(_key, self._compute(_values, transform, _key[2], 0))
+
+        return pd.Series(self._cache[_key], index = self.data.index, name = f"{column}_{transform}_{window}")
+
+    ##
+    #  Several features at once
+    #  @param specs iterable of (column, transform, window)
+    #  @return dataframe with one column per spec
+    #
+    def Features(self, specs):
+
+        return pd.concat([self.Feature(*spec) for spec in specs], axis = 1)
+
+    ##
+    #  Appends new weeks and extends every memoized feature, recomputing
+    #  only the new rows from the history each transform needs
+    #  @param rows new panel rows, with the columns of the current panel
+    #
+    def Append(self, rows):
+
+        _start    = len(self.data)
+        self.data = pd.concat([self.data, rows[self.data.columns]], ignore_index = True)
+
+        for _key, _head in self._cache.items():
+            _column, _transform, _window = _key
+            _values = self.data[_column].to_numpy("float64", na_value = np.nan)
+            self._cache[_key] = np.concatenate([_head, self._compute(_values, _transform, _window, _start)])
+
+    ##
+    #  Drops the memoized features
+    #
+    def Clear(self):
+
+        self._cache.clear()
+
+    def _store(self, key, values):
+
+        self._cache[key] = values
+
+        while len(self._cache) > self.maxEntries:
+            self._cache.popitem(last = False)
+
+    ##
+    #  Computes a transform for the rows from start on
+    #
+    def _compute(self, values, transform, window, start):
+
+        if transform == "seasonal":
+            return self._seasonal(values, start)
+
+        _history = window if transform in ("lag", "logreturn") else window - 1
+        _from    = max(start - _history, 0)
+        _result  = self._kernel(values[_from:], transform, window)
+
+        return _result[start - _from:]
+
+    def _kernel(self, x, transform, window):
+
+        _n   = len(x)
+        _out = np.full(_n, np.nan)
+
+        if transform == "lag":
+            if window < _n:
+                _out[window:] = x[:_n - window]
+            return _out
+
+        if transform == "logreturn":
+            if window < _n:
+                with np.errstate(divide = "ignore", invalid = "ignore"):
+                    _out[window:] = np.log(x[window:] / x[:_n - window])
+            return _out
+
+        if window > _n:
+            return _out
+
+        if transform in ("min", "max"):
+            _windows = sliding_window_view(x, window)
+            _out[window - 1:] = _windows.min(axis = 1) if transform == "min" else _windows.max(axis = 1)
+            return _out
+
+        ## Mean and std from cumulative sums, centred to limit cancellation
+        _missing = np.isnan(x)
+        _centre  = np.nanmean(x) if not _missing.all() else 0.0
+        _z       = np.where(_missing, 0.0, x - _centre)
+        _s1      = self._windowSum(_z, window)
+        _nans    = self._windowSum(_missing.astype("float64"), window)
+        _mean    = _s1 / window
+
+        if transform == "mean":
+            _stat = _mean + _centre
+        else:
+            _s2   = self._windowSum(_z * _z, window)
+            _stat = np.sqrt(np.maximum(_s2 - window * _mean * _mean, 0.0) / (window - 1)) if window > 1 \
+                    else np.full(len(_s1), np.nan)
+
+        _out[window - 1:] = np.where(_nans > 0, np.nan, _stat)
+
+        return _out
+
+    @staticmethod
+    def _windowSum(x, window):
+
+        _cum = np.concatenate([[0.0], np.cumsum(x)])
+
+        return _cum[window:] - _cum[:-window]
+
+    ##
+    #  Difference against the row of the same ISO week one year earlier,
+    #  found by binary search on integer Year/Week codes
+    #
+    def _seasonal(self, values, start):
+
+        _codes  = self.data["Year"].to_numpy("int64") * 100 + self.data["Week"].to_numpy("int64")
+        _order  = np.argsort(_codes, kind = "stable")
+        _sorted = _codes[_order]
+        _target = _codes[start:] - 100
+        _pos    = np.minimum(np.searchsorted(_sorted, _target), len(_sorted) - 1)
+        _found  = _sorted[_pos] == _target
+        _out    = np.full(len(_target), np.nan)
+
+        _out[_found] = values[start:][_found] - values[_order[_pos[_found]]]
+
+        return _out
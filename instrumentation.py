@@ -0,0 +1,140 @@
+##
+#  This module constructs the Instrumentation class
+##
+
+##
+#  Imports libraries needed
+#
+import logging
+import time
+import tracemalloc
+
+import pandas as pd
+
+##
+# This class records, for each stage of each DataLoader loader and of the
+# merge, the duration, rows in and out, and memory. Loaders mark the end
+# of their stages on a tracker; when instrumentation is disabled they get a
+# shared tracker whose marks do nothing.
+#
+class Instrumentation:
+
+    COLUMNS = ["loader", "stage", "seconds", "rowsIn", "rowsOut", "bytesOut", "allocatedBytes"]
+
+    ##
+    #  @param log         emits one log line per stage on the "data_loader" logger
+    #  @param traceMemory measures the bytes allocated by each stage with
+    #                     tracemalloc, which slows the loaders down
+    #
+    def __init__(self, log = False, traceMemory = False):
+
+        self.log         = log
+        self.traceMemory = traceMemory
+        self.records     = []
+        self.logger      = logging.getLogger("data_loader")
+
+    ##
+    #  Starts tracking the stages of a loader
+    #  @param loader label of the loader
+    #  @return Tracker whose Mark() closes each stage
+    #
+    def Track(self, loader):
+
+        if self.traceMemory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        return Tracker(self, loader)
+
+    ##
+    #  Recorded stages
+    #  @return dataframe with one row per stage, in recording order
+    #
+    def Report(self):
+
+        return pd.DataFrame(self.records, columns = self.COLUMNS)
+
+    ##
+    #  Time and rows per stage name, summed over the loaders
+    #  @return dataframe indexed by stage, slowest first
+    #
+    def Summary(self):
+
+        return (self.Report()
+                .groupby("stage")[["seconds", "rowsOut", "allocatedBytes"]]
+                .sum(min_count = 1)
+                .sort_values("seconds", ascending = False))
+
+    ##
+    #  Drops the recorded stages
+    #
+    def Clear(self):
+
+        self.records = []
+
+    def _record(self, record):
+
+        self.records.append(record)
+
+        if self.log:
+            self.logger.info("%s %s: %.4fs rows %s -> %s", record["loader"], record["stage"],
+                             record["seconds"], record["rowsIn"], record["rowsOut"])
+
+
+##
+# This class closes the stages of one loader run, each stage lasting from
+# the previous mark
+#
+class Tracker:
+
+    def __init__(self, instrumentation, loader):
+
+        self.instrumentation = instrumentation
+        self.loader          = loader
+        self._rows           = None
+        self._start          = time.perf_counter()
+        self._memory         = self._traced()
+
+    ##
+    #  Records the stage ending now
+    #  @param stage name of the stage
+    #  @param data  dataframe produced by the stage, if any
+    #
+    def Mark(self, stage, data = None):
+
+        _now    = time.perf_counter()
+        _memory = self._traced()
+        _rows   = len(data) if data is not None else None
+
+        self.instrumentation._record({
+            "loader"        : self.loader,
+            "stage"         : stage,
+            "seconds"       : _now - self._start,
+            "rowsIn"        : self._rows,
+            "rowsOut"       : _rows,
+            "bytesOut"      : int(data.memory_usage().sum()) if isinstance(data, pd.DataFrame) else None,
+            "allocatedBytes": _memory - self._memory if _memory is not None else None
+        })
+
+        self._rows   = _rows if _rows is not None else self._rows
+        self._start  = time.perf_counter()
+        self._memory = self._traced()
+
+    def _traced(self):
+
+        if not self.instrumentation.traceMemory:
+            return None
+
+        return tracemalloc.get_traced_memory()[0]
+
+
+##
+# Tracker used when instrumentation is disabled
+#
+class _NullTracker:
+
+    def Mark(self, stage, data = None):
+
+        pass
+
+
+NULL_TRACKER = _NullTracker()
@@ -0,0 +1,166 @@
+##
+#  This module constructs the IsoCalendar class
+##
+
+##
+#  Imports libraries needed
+#
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+##
+# This class converts between ISO year/week and the Monday date of the week
+# with integer arithmetic on NumPy arrays, replacing the
+# "YYYY-Www-1" string round-trip through pd.to_datetime.
+#
+class IsoCalendar:
+
+    ## Leap days between year 0 and 1969, days counted from 1970-01-01
+    _EPOCH_LEAPS = 1969 // 4 - 1969 // 100 + 1969 // 400
+
+    ##
+    #  Weekly calendar shared by every caller in the process, built once
+    #  @return WeekCalendar over the supported range
+    #
+    @staticmethod
+    @lru_cache(maxsize = None)
+    def Weekly():
+
+        return WeekCalendar()
+
+    ##
+    #  Days from 1970-01-01 to the 1st of January of each year
+    #  @param year integer array of years
+    #  @return integer array of day numbers
+    #
+    @staticmethod
+    def YearStart(year):
+
+        _prev = np.asarray(year, dtype = "int64") - 1
+
+        return 365 * (_prev - 1969) + (_prev // 4 - _prev // 100 + _prev // 400) - IsoCalendar._EPOCH_LEAPS
+
+    ##
+    #  Monday of an ISO week
+    #  @param year ISO year, scalar or array
+    #  @param week ISO week, scalar or array
+    #  @return datetime64[ns] array of Mondays
+    #
+    @staticmethod
+    def WeekToDate(year, week):
+
+        return IsoCalendar.WeekToDay(year, week).astype("datetime64[D]").astype("datetime64[ns]")
+
+    ##
+    #  Monday of an ISO week as a day number from 1970-01-01
+    #  @param year ISO year, scalar or array
+    #  @param week ISO week, scalar or array
+    #  @return integer array of day numbers
+    #
+    @staticmethod
+    def WeekToDay(year, week):
+
+        _jan4   = IsoCalendar.YearStart(year) + 3
+        _monday = _jan4 - (_jan4 + 3) % 7
+
+        return _monday + 7 * (np.asarray(week, dtype = "int64") - 1)
+
+    ##
+    #  ISO year and week of each date
+    #  @param dates datetime64 array or Series
+    #  @return tuple of integer arrays (ISO year, ISO week)
+    #
+    @staticmethod
+    def DateToWeek(dates):
+
+        _days     = np.asarray(dates, dtype = "datetime64[D]").astype("int64")
+        _thursday = _days - (_days + 3) % 7 + 3
+        _year     = _thursday.astype("datetime64[D]").astype("datetime64[Y]").astype("int64") + 1970
+        _week     = (_thursday - IsoCalendar.YearStart(_year)) // 7 + 1
+
+        return _year, _week
+
+    ##
+    #  Calendar month of each date
+    #  @param dates datetime64 array or Series
+    #  @return integer array of months, 1 to 12
+    #
+    @staticmethod
+    def Month(dates):
+
+        return np.asarray(dates, dtype = "datetime64[M]").astype("int64") % 12 + 1
+
+
+##
+# This class precomputes, for every ISO week of the supported range, the
+# Monday, ISO year and week, calendar month of the Monday, weekly period
+# and an integer week ordinal. Weeks are looked up by integer position,
+# the ordinal, instead of recomputing the calendar of each frame.
+#
+class WeekCalendar:
+
+    ## Mondays of the first and last supported weeks
+    FIRST = "1900-01-01"
+    LAST  = "2099-12-28"
+
+    def __init__(self, first = FIRST, last = LAST):
+
+        self.first   = int(np.datetime64(first, "D").astype("int64"))
+        _days        = np.arange(self.first, int(np.datetime64(last, "D").astype("int64")) + 1, 7)
+        self.ordinal = np.arange(len(_days))
+        self.dates   = _days.astype("datetime64[D]").astype("datetime64[ns]")
+        self.year, self.week = IsoCalendar.DateToWeek(self.dates)
+        self.month   = IsoCalendar.Month(self.dates)
+        self.period  = pd.PeriodIndex(self.dates, freq = "W")
+
+        if (_days[0] + 3) % 7 != 0:
+            raise ValueError(f"First week must start on a Monday: {first}")
+
+    def __len__(self):
+
+        return len(self.ordinal)
+
+    ##
+    #  Ordinal of the week holding each date
+    #  @param dates datetime64 array or Series
+    #  @return integer array of positions in the calendar
+    #
+    def Position(self, dates):
+
+        _days = np.asarray(dates, dtype = "datetime64[D]").astype("int64")
+
+        return self._check(_days - (_days + 3) % 7)
+
+    ##
+    #  Ordinal of each ISO week
+    #  @param year ISO year, scalar or array
+    #  @param week ISO week, scalar or array
+    #  @return integer array of positions in the calendar
+    #
+    def WeekPosition(self, year, week):
+
+        return self._check(IsoCalendar.WeekToDay(year, week))
+
+    ##
+    #  Calendar frame of a run of weeks, as used by Data()
+    #  @param positions integer array of week ordinals
+    #  @return dataframe with Date, ISO Year and Week (UInt32) and Month (int32)
+    #
+    def Frame(self, positions):
+
+        return pd.DataFrame({"Date" : self.dates[positions],
+                             "Year" : pd.array(self.year[positions], dtype = "UInt32"),
+                             "Week" : pd.array(self.week[positions], dtype = "UInt32"),
+                             "Month": self.month[positions].astype("int32")})
+
+    def _check(self, mondays):
+
+        _positions = (np.asarray(mondays, dtype = "int64") - self.first) // 7
+
+        if len(_positions) and (_positions.min() < 0 or _positions.max() >= len(self.ordinal)):
+            raise ValueError("Dates outside the supported calendar "
+                             f"{self.dates[0].astype('datetime64[D]')} to {self.dates[-1].astype('datetime64[D]')}")
+
+        return _positions
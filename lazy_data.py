@@ -0,0 +1,73 @@
+##
+#  This module constructs the LazyData class
+##
+
+##
+#  Imports libraries needed
+#
+import pandas as pd
+
+##
+# This class is a lazy view of the DataLoader panel. Selecting columns
+# loads and merges only the loaders producing them, the Fish Pool prices
+# always load since they define the weekly calendar. Loaded sources are
+# kept, so later selections only parse the sources still missing.
+#
+class LazyData:
+
+    KEYS = ["t", "Date", "Year", "Week", "Month"]
+
+    def __init__(self, loader):
+
+        self.loader   = loader
+        self._sources = {}
+        self._owner   = {col: name for name, cols in loader.SOURCE_COLUMNS.items() for col in cols}
+
+    ##
+    #  Columns available, in the order of Data()
+    #
+    @property
+    def columns(self):
+
+        _loader = self.loader
+
+        return pd.Index(self.KEYS + [col for name in ["SalmonPriceFishPool"] + _loader.WEEKLY_SOURCES
+                                     + _loader.MONTHLY_SOURCES for col in _loader.SOURCE_COLUMNS[name]])
+
+    ##
+    #  Loader producing a column
+    #  @param column panel column
+    #  @return loader method name
+    #
+    def Source(self, column):
+
+        if column not in self._owner:
+            raise KeyError(column)
+
+        return self._owner[column]
+
+    ##
+    #  Loads the sources of the requested columns and merges them
+    #  @param columns panel columns, the key columns are always returned
+    #  @param parallel loads the missing sources concurrently
+    #  @return dataframe with the key columns and the requested ones,
+    #          equal to the same selection on Data()
+    #
+    def Select(self, columns, parallel = False):
+
+        _columns = [col for col in columns if col not in self.KEYS]
+        _names   = ["SalmonPriceFishPool"] + [self.Source(col) for col in _columns]
+        _missing = [name for name in dict.fromkeys(_names) if name not in self._sources]
+
+        self._sources.update(self.loader._loadSources(_missing, parallel))
+
+        data = self.loader._merge({name: self._sources[name] for name in _names})
+
+        return data[self.KEYS + list(dict.fromkeys(_columns))]
+
+    def __getitem__(self, columns):
+
+        if isinstance(columns, str):
+            return self.Select([columns])[columns]
+
+        return self.Select(columns)
@@ -0,0 +1,112 @@
+##
+#  This module constructs the ModelMatrix class
+##
+
+##
+#  Imports libraries needed
+#
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+##
+# This class holds the merged dataset as one read-only, memory-mapped
+# NumPy file, with a JSON sidecar carrying the column names, dtypes and
+# weekly dates. Every process loading the same file maps the same pages,
+# so N workers share one physical copy of the panel.
+#
+class ModelMatrix:
+
+    MATRIX_SUFFIX = ".npy"
+    META_SUFFIX   = ".json"
+
+    def __init__(self, matrix, columns, dtypes, dates):
+
+        self.matrix  = matrix
+        self.columns = list(columns)
+        self.dtypes  = dict(dtypes)
+        self.dates   = dates
+
+    ##
+    #  Writes the numeric columns of a panel as a column-major float matrix
+    #  @param data  dataframe returned by DataLoader.Data()
+    #  @param path  file path without extension
+    #  @param dtype dtype of the matrix
+    #  @return ModelMatrix mapping the written file
+    #
+    @staticmethod
+    def Export(data, path, dtype = "float64"):
+
+        _numeric = data.select_dtypes(include = "number")
+        _meta    = {"columns": [str(col) for col in _numeric.columns],
+                    "dtypes" : {str(col): str(t) for col, t in _numeric.dtypes.items()},
+                    "dates"  : [str(p.start_time.date()) for p in data["Date"]] if "Date" in data else None,
+                    "freq"   : data["Date"].dtype.freq.freqstr if "Date" in data else None,
+                    "rows"   : len(_numeric)}
+
+        _matrixPath = path + ModelMatrix.MATRIX_SUFFIX
+        _tmp        = f"{path}.{os.getpid()}.tmp{ModelMatrix.MATRIX_SUFFIX}"
+        _matrix     = np.lib.format.open_memmap(_tmp, mode = "w+", dtype = dtype,
+                                                shape = _numeric.shape, fortran_order = True)
+
+        for i, col in enumerate(_numeric.columns):
+            _matrix[:, i] = _numeric[col].to_numpy("float64", na_value = np.nan)
+
+        _matrix.flush()
+        del _matrix
+        os.replace(_tmp, _matrixPath)
+
+        with open(path + ModelMatrix.META_SUFFIX, "w", encoding = "utf-8") as _file:
+            json.dump(_meta, _file, ensure_ascii = False)
+
+        return ModelMatrix.Load(path)
+
+    ##
+    #  Maps an exported matrix read-only, without copying it
+    #  @param path file path without extension
+    #  @return ModelMatrix over the mapped file
+    #
+    @staticmethod
+    def Load(path):
+
+        with open(path + ModelMatrix.META_SUFFIX, encoding = "utf-8") as _file:
+            _meta = json.load(_file)
+
+        _matrix = np.load(path + ModelMatrix.MATRIX_SUFFIX, mmap_mode = "r")
+        _dates  = (pd.PeriodIndex(pd.to_datetime(_meta["dates"]), freq = _meta["freq"])
+                   if _meta["dates"] is not None else None)
+
+        return ModelMatrix(_matrix, _meta["columns"], _meta["dtypes"], _dates)
+
+    ##
+    #  Column of the matrix
+    #  @param name column name
+    #  @return read-only view on the mapped file
+    #
+    def Column(self, name):
+
+        return self.matrix[:, self.columns.index(name)]
+
+    ##
+    #  Dataframe over the matrix
+    #  @param columns subset of columns, all when None
+    #  @param restoreDtypes casts back to the exported dtypes, which copies
+    #  @return dataframe, a zero-copy view of the mapped file when every
+    #          column is selected and restoreDtypes is False
+    #
+    def Frame(self, columns = None, restoreDtypes = False):
+
+        _columns = list(columns) if columns is not None else self.columns
+        _indices = [self.columns.index(col) for col in _columns]
+        _matrix  = self.matrix if _indices == list(range(len(self.columns))) else self.matrix[:, _indices]
+        frame    = pd.DataFrame(_matrix, columns = _columns, copy = False)
+
+        if self.dates is not None:
+            frame.index = self.dates.rename("Date")
+
+        if restoreDtypes:
+            frame = frame.astype({col: self.dtypes[col] for col in _columns})
+
+        return frame
@@ -0,0 +1,181 @@
+##
+#  This module constructs the ScenarioEngine class
+##
+
+##
+#  Imports libraries needed
+#
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from temporal_disaggregation import TemporalDisaggregation
+
+##
+# This class revalues the salmon export revenues of the weekly panel
+# returned by DataLoader.Data() under batches of price and FX scenarios.
+# The base revenue of a week is its USD export value converted at USDNOK.
+# A scenario reprices it by the ratio of its Fish Pool NOK price to the
+# panel's, the exported volume being unchanged, and converts it to EUR and
+# USD at its own EURNOK and USDNOK. All scenarios are evaluated as one
+# broadcast operation, in chunks of scenarios bounding the temporary
+# arrays, and optionally sharded over a process pool whose workers map the
+# shocks from one memory-mapped file.
+#
+class ScenarioEngine:
+
+    ## Last axis of the shock arrays, and currencies of the revenues
+    FACTORS    = ["price", "EURNOK", "USDNOK"]
+    CURRENCIES = ["NOK", "EUR", "USD"]
+
+    ##
+    #  @param data        dataframe returned by DataLoader.Data()
+    #  @param exportValue USD export value column
+    #  @param price       Fish Pool NOK price column
+    #  @param eurnok      EURNOK column
+    #  @param usdnok      USDNOK column
+    #  @param disaggregate method spreading a monthly export value over its
+    #                      weeks so that they sum to it, one of
+    #                      TemporalDisaggregation.METHODS, or None when the
+    #                      column already holds weekly values
+    #  @param chunkBytes  size of the revenue arrays computed at once
+    #
+    def __init__(self, data, exportValue = "Salmon_Export_Value_USD_Monthly", price = "Salmon_NOK_kg_FP_Weekly",
+                 eurnok = "EURNOK_Weekly", usdnok = "USDNOK_Weekly", disaggregate = "step",
+                 chunkBytes = 64 * 2 ** 20):
+
+        _data = data.sort_values("t").reset_index(drop = True)
+
+        if disaggregate is not None:
+            _data = TemporalDisaggregation(disaggregate).Panel(_data, [exportValue], [exportValue])
+
+        _values = _data[[exportValue, price, eurnok, usdnok]].to_numpy("float64", na_value = np.nan)
+
+        self.t          = _data["t"].to_numpy()
+        self.chunkBytes = chunkBytes
+
+        ## Base NOK revenue, price, EURNOK and USDNOK per week
+        self.base = np.column_stack([_values[:, 0] * _values[:, 3], _values[:, 1:]])
+
+    ##
+    #  Base revenues of the panel, those of a scenario without shocks
+    #  @return dictionary of currency to array of shape (weeks,)
+    #
+    def Base(self):
+
+        return dict(zip(self.CURRENCIES, [self.base[:, 0], self.base[:, 0] / self.base[:, 2],
+                                          self.base[:, 0] / self.base[:, 3]]))
+
+    ##
+    #  Revenues of a batch of scenarios
+    #  @param shocks   array of shape (scenarios, 3), one shock per factor
+    #                  held over every week, or (scenarios, weeks, 3), one
+    #                  path per factor, factors in FACTORS order
+    #  @param levels   False when shocks are relative changes of the panel's
+    #                  price and rates, True when they are the price and rates
+    #  @param total    sums the weeks of each scenario
+    #  @param parallel shards the scenarios over a process pool
+    #  @param workers  number of worker processes, one per CPU when None
+    #  @return dictionary of currency to array of shape (scenarios, weeks),
+    #          or (scenarios,) when total. Weeks missing a base value are
+    #          NaN, and left out of the totals
+    #
+    def Revalue(self, shocks, levels = False, total = False, parallel = False, workers = None):
+
+        _shocks = np.asarray(shocks, dtype = "float64")
+
+        if _shocks.ndim not in (2, 3) or _shocks.shape[-1] != len(self.FACTORS) \
+                or (_shocks.ndim == 3 and _shocks.shape[1] != len(self.base)):
+            raise ValueError(f"Expected shocks of shape (scenarios, {len(self.FACTORS)}) or "
+                             f"(scenarios, {len(self.base)}, {len(self.FACTORS)}), got {_shocks.shape}")
+
+        _chunk = max(1, self.chunkBytes // (len(self.base) * len(self.CURRENCIES) * 8))
+
+        if not parallel or len(_shocks) <= _chunk:
+            _out = _revalue(self.base, _shocks, levels, total, _chunk)
+        else:
+            _workers = workers or os.cpu_count() or 1
+            _shards  = np.array_split(np.arange(len(_shocks)), min(_workers, -(-len(_shocks) // _chunk)))
+
+            with tempfile.TemporaryDirectory(prefix = "laks_scenarios_") as _dir:
+                _path = os.path.join(_dir, "shocks.npy")
+                np.save(_path, _shocks)
+
+                with ProcessPoolExecutor(max_workers = _workers, initializer = _initWorker,
+                                         initargs = (self.base, _path)) as _pool:
+                    _parts = list(_pool.map(_revalueShard, [(s[0], s[-1] + 1) for s in _shards],
+                                            [levels] * len(_shards), [total] * len(_shards),
+                                            [_chunk] * len(_shards)))
+
+            _out = np.concatenate(_parts, axis = 1)
+
+        return dict(zip(self.CURRENCIES, _out))
+
+
+##
+#  Revenues of a batch of scenarios, chunk by chunk, or from the weekly
+#  sums of the base revenues for totals of shocks held over the weeks
+#  @param base   array of (NOK revenue, price, EURNOK, USDNOK) per week
+#  @param shocks shocks as given to ScenarioEngine.Revalue()
+#  @param levels True when shocks are levels
+#  @param total  sums the weeks of each scenario
+#  @param chunk  scenarios computed at once
+#  @return array of shape (currencies, scenarios, weeks), or (currencies, scenarios)
+#
+def _revalue(base, shocks, levels, total, chunk):
+
+    ## Shocks held over the weeks scale the weekly sums of the base revenues
+    if total and shocks.ndim == 2:
+        if levels:
+            _nok = shocks[:, 0] * np.nansum(base[:, 0] / base[:, 1])
+            return np.stack([_nok, _nok / shocks[:, 1], _nok / shocks[:, 2]])
+
+        _sums = np.nansum([base[:, 0], base[:, 0] / base[:, 2], base[:, 0] / base[:, 3]], axis = 1)
+        _rate = np.column_stack([np.ones(len(shocks)), 1.0 + shocks[:, 1:]])
+
+        return ((1.0 + shocks[:, [0]]) * _sums / _rate).T
+
+    _out = np.empty((3, len(shocks)) if total else (3, len(shocks), len(base)))
+
+    for _start in range(0, len(shocks), chunk):
+        _shock = shocks[_start:_start + chunk]
+        _shock = _shock[:, None, :] if _shock.ndim == 2 else _shock
+
+        if levels:
+            _nok = base[:, 0] * (_shock[..., 0] / base[:, 1])
+            _eur = _nok / _shock[..., 1]
+            _usd = _nok / _shock[..., 2]
+        else:
+            _nok = base[:, 0] * (1.0 + _shock[..., 0])
+            _eur = _nok / (base[:, 2] * (1.0 + _shock[..., 1]))
+            _usd = _nok / (base[:, 3] * (1.0 + _shock[..., 2]))
+
+        _end = _start + len(_shock)
+
+        for i, _revenue in enumerate([_nok, _eur, _usd]):
+            _out[i, _start:_end] = np.nansum(_revenue, axis = 1) if total else _revenue
+
+    return _out
+
+
+## Base revenues and shocks mapped by each worker process
+_WORKER_BASE   = None
+_WORKER_SHOCKS = None
+
+
+def _initWorker(base, path):
+
+    global _WORKER_BASE, _WORKER_SHOCKS
+
+    _WORKER_BASE   = base
+    _WORKER_SHOCKS = np.load(path, mmap_mode = "r")
+
+
+##
+#  Revenues of a contiguous shard of scenarios in a worker process
+#
+def _revalueShard(shard, levels, total, chunk):
+
+    return _revalue(_WORKER_BASE, _WORKER_SHOCKS[shard[0]:shard[1]], levels, total, chunk)
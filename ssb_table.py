@@ -0,0 +1,108 @@
+##
+#  This module constructs the SsbTable class
+##
+
+##
+#  Imports libraries needed
+#
+import numpy as np
+import pandas as pd
+
+from iso_calendar import IsoCalendar
+
+##
+# This class turns the layouts of Statistics Norway (SSB) table exports
+# into tidy Year/Month or Year/Week/Month frames: wide year x month tables
+# by reshaping the value block, and "YYYYUww" / "YYYYMmm" period codes by
+# integer arithmetic on their bytes, without formatting or parsing a string
+# per cell.
+#
+class SsbTable:
+
+    ## Separators of the weekly and monthly period codes
+    WEEK  = "U"
+    MONTH = "M"
+
+    ##
+    #  Year and period of fixed-width "YYYY<sep>pp" codes
+    #  @param codes     array or Series of codes, as str or bytes
+    #  @param separator period letter, WEEK or MONTH
+    #  @return tuple of integer arrays (year, period)
+    #
+    @staticmethod
+    def Codes(codes, separator):
+
+        _codes = np.asarray(codes, dtype = "S7")
+        _bytes = _codes.view(np.uint8).reshape(len(_codes), 7).astype("int64")
+        _digit = _bytes[:, [0, 1, 2, 3, 5, 6]] - ord("0")
+        _bad   = ((_digit < 0) | (_digit > 9)).any(axis = 1) | (_bytes[:, 4] != ord(separator))
+
+        if _bad.any():
+            raise ValueError(f"Malformed SSB period codes, expected YYYY{separator}pp: {_codes[_bad][:5]}")
+
+        _year   = _digit[:, :4] @ np.array([1000, 100, 10, 1])
+        _period = _digit[:, 4] * 10 + _digit[:, 5]
+
+        return _year, _period
+
+    ##
+    #  Tidy weekly frame from a column of "YYYYUww" codes
+    #  @param codes  array or Series of week codes
+    #  @param values dictionary of output column to values, one per code
+    #  @return dataframe with Year, ISO Week, Month of the week's Monday
+    #          (int64) and the value columns (float64)
+    #
+    @staticmethod
+    def Weekly(codes, values):
+
+        _year, _week = SsbTable.Codes(codes, SsbTable.WEEK)
+        _calendar    = IsoCalendar.Weekly()
+
+        dataTransform = pd.DataFrame({"Year" : _year,
+                                      "Week" : _week,
+                                      "Month": _calendar.month[_calendar.WeekPosition(_year, _week)]})
+
+        for col, _values in values.items():
+            dataTransform[col] = np.asarray(_values, dtype = "float64")
+
+        return dataTransform
+
+    ##
+    #  Tidy monthly frame from a column of "YYYYMmm" codes
+    #  @param codes  array or Series of month codes
+    #  @param values dictionary of output column to values, one per code
+    #  @return dataframe with Year, Month (int64) and the value columns (float64)
+    #
+    @staticmethod
+    def Monthly(codes, values):
+
+        _year, _month = SsbTable.Codes(codes, SsbTable.MONTH)
+
+        dataTransform = pd.DataFrame({"Year": _year, "Month": _month})
+
+        for col, _values in values.items():
+            dataTransform[col] = np.asarray(_values, dtype = "float64")
+
+        return dataTransform
+
+    ##
+    #  Tidy monthly frame from a wide table of one row per year and one
+    #  column per month
+    #  @param years  array or Series of years, one per row
+    #  @param months 2D array or dataframe of shape (years, 12), January first
+    #  @param column name of the value column
+    #  @return dataframe with Year, Month (int64) and the values (float64),
+    #          ordered by year as given then month
+    #
+    @staticmethod
+    def YearMonth(years, months, column):
+
+        _years  = np.asarray(years, dtype = "int64")
+        _values = np.asarray(months, dtype = "float64")
+
+        if _values.shape != (len(_years), 12):
+            raise ValueError(f"Expected one row of 12 months per year, got {_values.shape}")
+
+        return pd.DataFrame({"Year" : np.repeat(_years, 12),
+                             "Month": np.tile(np.arange(1, 13), len(_years)),
+                             column : _values.ravel()})
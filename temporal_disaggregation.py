@@ -0,0 +1,273 @@
+##
+#  This module constructs the TemporalDisaggregation class
+##
+
+##
+#  Imports libraries needed
+#
+import importlib.util
+from collections import OrderedDict
+
+import numpy as np
+
+##
+# This class converts the monthly series of the weekly panel, which the
+# merge repeats over the weeks of each month, into weekly series. Three
+# methods are offered: step (the repeated value), linear interpolation
+# between month centres, and additive first-difference Denton, the
+# smoothest weekly path whose weeks average (levels) or sum (flows) to each
+# month. Each method is a weights matrix from months to weeks, solved once
+# per calendar and reused for every series of that calendar. When later
+# runs add months, only the tail is solved again, over an overlap window
+# wide enough for the earlier weeks to be unaffected.
+#
+class TemporalDisaggregation:
+
+    METHODS     = ["step", "linear", "denton"]
+    CONVERSIONS = ["average", "sum"]
+    SCIPY       = importlib.util.find_spec("scipy") is not None
+
+    ##
+    #  @param method     one of METHODS
+    #  @param overlap    months solved again before the first changed month
+    #  @param maxEntries number of weights matrices kept
+    #
+    def __init__(self, method = "denton", overlap = 24, maxEntries = 16):
+
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown disaggregation method: {method}")
+
+        self.method     = method
+        self.overlap    = overlap
+        self.maxEntries = maxEntries
+        self._weights   = OrderedDict()
+        self._last      = None
+
+    ##
+    #  Weights from months to weeks, memoized per calendar
+    #  @param counts     number of weeks of each month, in order
+    #  @param conversion "average" when the weeks of a month average to its
+    #                    value, "sum" when they add up to it
+    #  @return array of shape (weeks, months)
+    #
+    def Weights(self, counts, conversion = "average"):
+
+        if conversion not in self.CONVERSIONS:
+            raise ValueError(f"Unknown conversion: {conversion}")
+
+        _counts = np.asarray(counts, dtype = "int64")
+        _key    = (conversion, _counts.tobytes())
+
+        if _key in self._weights:
+            self._weights.move_to_end(_key)
+            return self._weights[_key]
+
+        _weights = {"step"  : self._step,
+                    "linear": self._linear,
+                    "denton": self._denton}[self.method](_counts, conversion)
+
+        self._weights[_key] = _weights
+
+        while len(self._weights) > self.maxEntries:
+            self._weights.popitem(last = False)
+
+        return _weights
+
+    ##
+    #  Weekly series of monthly series
+    #  @param monthly    array of shape (months,) or (months, series)
+    #  @param counts     number of weeks of each month
+    #  @param conversion "average" or "sum"
+    #  @return array of shape (weeks,) or (weeks, series). A series with
+    #          missing months is solved over its first to last valid month,
+    #          and falls back to step when months are missing in between
+    #
+    def Weekly(self, monthly, counts, conversion = "average"):
+
+        _monthly = np.asarray(monthly, dtype = "float64")
+        _values  = _monthly.reshape(len(_monthly), -1)
+        _counts  = np.asarray(counts, dtype = "int64")
+        _starts  = np.concatenate([[0], np.cumsum(_counts)])
+        _weekly  = np.full((_starts[-1], _values.shape[1]), np.nan)
+        _valid   = ~np.isnan(_values)
+        _spans   = {}
+
+        ## Series sharing their valid months are solved together
+        for i in range(_values.shape[1]):
+            _months = np.flatnonzero(_valid[:, i])
+
+            if not len(_months):
+                continue
+
+            _gaps = len(_months) != _months[-1] - _months[0] + 1
+            _spans.setdefault((_months[0], _months[-1], _gaps), []).append(i)
+
+        for (_first, _last, _gaps), _columns in _spans.items():
+            _span  = _counts[_first:_last + 1]
+            _block = _values[_first:_last + 1, _columns]
+            _rows  = slice(_starts[_first], _starts[_last + 1])
+
+            if _gaps:
+                _weekly[_rows, _columns] = np.repeat(_block / (_span[:, None] if conversion == "sum" else 1),
+                                                     _span, axis = 0)
+            else:
+                _weekly[_rows, _columns] = self.Weights(_span, conversion) @ _block
+
+        return _weekly.reshape(-1) if _monthly.ndim == 1 else _weekly
+
+    ##
+    #  Disaggregates monthly columns of the weekly panel. The months are the
+    #  runs of calendar year and month of each week's Monday, and their value
+    #  is read on a week whose ISO year is that calendar year, the weeks of
+    #  late December belonging to the next ISO year being merged with the
+    #  next year's month. Months cut by the panel edges are constrained over
+    #  the weeks they have in the panel. Months equal to the previous
+    #  call's are kept, except the last overlap months before the first
+    #  changed one, which are solved again with another overlap months of
+    #  history so that earlier weeks are unaffected
+    #  @param data    dataframe returned by DataLoader.Data(), ordered by t
+    #  @param columns monthly columns, those named "_Monthly" when None
+    #  @param flows   columns whose weeks sum to the month, the others average to it
+    #  @return copy of data with the columns replaced by their weekly series
+    #
+    def Panel(self, data, columns = None, flows = ()):
+
+        _columns = list(columns) if columns is not None else list(data.columns[data.columns.str.contains("_Monthly")])
+        _year    = data["Date"].dt.start_time.dt.year.to_numpy("int64")
+        _codes   = _year * 12 + data["Month"].to_numpy("int64")
+        _firsts  = np.flatnonzero(np.concatenate([[True], _codes[1:] != _codes[:-1]]))
+        _counts  = np.diff(np.concatenate([_firsts, [len(_codes)]]))
+
+        ## Value of each month on its first week aligned by ISO year, its first week otherwise
+        _aligned = np.flatnonzero(data["Year"].to_numpy("int64") == _year)
+        _rows    = _aligned[np.minimum(np.searchsorted(_aligned, _firsts), len(_aligned) - 1)] if len(_aligned) \
+                   else _firsts
+        _rows    = np.where((_rows >= _firsts) & (_rows < _firsts + _counts), _rows, _firsts)
+        _monthly = data[_columns].to_numpy("float64", na_value = np.nan)[_rows]
+        _flows   = np.isin(_columns, list(flows))
+
+        _keep    = max(self._firstChange(_columns, _codes[_firsts], _counts, _monthly, _flows) - self.overlap, 0)
+        _from    = max(_keep - self.overlap, 0)
+        _weeks   = int(_counts[:_keep].sum())
+        _skip    = _weeks - int(_counts[:_from].sum())
+        _weekly  = np.empty((len(data), len(_columns)))
+
+        if _keep > 0:
+            _weekly[:_weeks] = self._last["weekly"][:_weeks]
+
+        for _conversion, _mask in [("sum", _flows), ("average", ~_flows)]:
+            if _mask.any():
+                _weekly[_weeks:, _mask] = self.Weekly(_monthly[_from:, _mask], _counts[_from:], _conversion)[_skip:]
+
+        self._last = {"columns": _columns, "codes": _codes[_firsts], "counts": _counts,
+                      "monthly": _monthly, "flows": _flows, "weekly": _weekly}
+
+        result = data.copy()
+        result[_columns] = _weekly
+
+        return result
+
+    ##
+    #  Drops the memoized weights and the previous panel
+    #
+    def Clear(self):
+
+        self._weights.clear()
+        self._last = None
+
+    ##
+    #  First month differing from the previous Panel() call, 0 without one
+    #
+    def _firstChange(self, columns, codes, counts, monthly, flows):
+
+        _last = self._last
+
+        if _last is None or _last["columns"] != columns or not np.array_equal(_last["flows"], flows):
+            return 0
+
+        _months = min(len(codes), len(_last["codes"]))
+        _same   = ((codes[:_months] == _last["codes"][:_months])
+                   & (counts[:_months] == _last["counts"][:_months])
+                   & ((monthly[:_months] == _last["monthly"][:_months])
+                      | (np.isnan(monthly[:_months]) & np.isnan(_last["monthly"][:_months]))).all(axis = 1))
+
+        return int(np.argmin(_same)) if not _same.all() else _months
+
+    ##
+    #  Aggregation matrix of shape (months, weeks)
+    #
+    @staticmethod
+    def _aggregation(counts, conversion):
+
+        _month = np.repeat(np.arange(len(counts)), counts)
+        _C     = np.zeros((len(counts), len(_month)))
+
+        _C[_month, np.arange(len(_month))] = 1.0 / counts[_month] if conversion == "average" else 1.0
+
+        return _C
+
+    @staticmethod
+    def _step(counts, conversion):
+
+        _weights = TemporalDisaggregation._aggregation(counts, "sum").T
+
+        return _weights / counts if conversion == "sum" else _weights
+
+    ##
+    #  Linear interpolation of the month values, or of the weekly rate for
+    #  flows, between month centres, flat beyond the first and last centres
+    #
+    @staticmethod
+    def _linear(counts, conversion):
+
+        _weeks   = np.arange(counts.sum())
+        _centres = np.concatenate([[0], np.cumsum(counts)[:-1]]) + (counts - 1) / 2
+        _right   = np.clip(np.searchsorted(_centres, _weeks, side = "right"), 1, max(len(counts) - 1, 1))
+        _left    = _right - 1
+        _weights = np.zeros((len(_weeks), len(counts)))
+
+        if len(counts) == 1:
+            _weights[:, 0] = 1.0
+        else:
+            _share = np.clip((_weeks - _centres[_left]) / (_centres[_right] - _centres[_left]), 0.0, 1.0)
+            _weights[_weeks, _left]  = 1.0 - _share
+            _weights[_weeks, _right] = _share
+
+        return _weights / counts if conversion == "sum" else _weights
+
+    ##
+    #  Additive first-difference Denton: minimises the squared week-on-week
+    #  changes subject to the monthly constraints, solving the KKT system
+    #  [[2 D'D, C'], [C, 0]] once for every month at the same time, sparse
+    #  when SciPy is installed and dense otherwise
+    #
+    @staticmethod
+    def _denton(counts, conversion):
+
+        _weeks  = int(counts.sum())
+        _months = len(counts)
+        _C      = TemporalDisaggregation._aggregation(counts, conversion)
+        _rhs    = np.vstack([np.zeros((_weeks, _months)), np.eye(_months)])
+
+        ## 2 D'D, D being the first-difference operator, is tridiagonal
+        _diag   = np.full(_weeks, 4.0)
+        _diag[[0, -1]] = 2.0 if _weeks > 1 else 0.0
+
+        if TemporalDisaggregation.SCIPY:
+            from scipy import sparse
+            from scipy.sparse.linalg import splu
+
+            _DD = sparse.diags([_diag, np.full(_weeks - 1, -2.0), np.full(_weeks - 1, -2.0)], [0, -1, 1])
+            _Cs = sparse.csr_matrix(_C)
+            _K  = sparse.bmat([[_DD, _Cs.T], [_Cs, None]], format = "csc")
+
+            return splu(_K).solve(_rhs)[:_weeks]
+
+        _K = np.zeros((_weeks + _months, _weeks + _months))
+        _K[np.arange(_weeks), np.arange(_weeks)]        = _diag
+        _K[np.arange(1, _weeks), np.arange(_weeks - 1)] = -2.0
+        _K[np.arange(_weeks - 1), np.arange(1, _weeks)] = -2.0
+        _K[:_weeks, _weeks:]                            = _C.T
+        _K[_weeks:, :_weeks]                            = _C
+
+        return np.linalg.solve(_K, _rhs)[:_weeks]
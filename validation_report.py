@@ -0,0 +1,98 @@
+##
+#  This module constructs the ValidationReport class
+##
+
+##
+#  Imports libraries needed
+#
+import pandas as pd
+
+##
+# This class holds the outcome of DataLoader.ValidateData(): one entry per
+# check with its pass/fail state, measured value and duration, plus the
+# tables behind the checks. Every check runs, so a report lists all the
+# failures of a panel rather than the first one.
+#
+class ValidationReport:
+
+    COLUMNS = ["check", "passed", "value", "seconds"]
+
+    def __init__(self):
+
+        self.checks  = []
+        self.details = {}
+
+    ##
+    #  Records a check
+    #  @param check   name of the check
+    #  @param passed  True when it passed, None for informational checks
+    #  @param value   measured value
+    #  @param seconds duration of the check
+    #  @param detail  table or list behind the check, kept in details
+    #
+    def Add(self, check, passed, value, seconds, detail = None):
+
+        self.checks.append({"check": check, "passed": passed, "value": value, "seconds": seconds})
+
+        if detail is not None:
+            self.details[check] = detail
+
+    ##
+    #  True when no check failed
+    #
+    @property
+    def passed(self):
+
+        return all(check["passed"] is not False for check in self.checks)
+
+    ##
+    #  Names of the failed checks
+    #
+    def Failures(self):
+
+        return [check["check"] for check in self.checks if check["passed"] is False]
+
+    ##
+    #  Checks as a dataframe, one row per check in running order
+    #
+    def Frame(self):
+
+        return pd.DataFrame(self.checks, columns = self.COLUMNS)
+
+    ##
+    #  Checks as plain Python values, for logging or JSON
+    #
+    def ToDict(self):
+
+        return {"passed" : self.passed,
+                "seconds": sum(check["seconds"] for check in self.checks),
+                "checks" : [dict(check, value = _plain(check["value"])) for check in self.checks]}
+
+    ##
+    #  Raises AssertionError listing the failed checks, if any
+    #
+    def Raise(self):
+
+        if not self.passed:
+            raise AssertionError(f"Data validation failed: {', '.join(self.Failures())}")
+
+    ##
+    #  Prints the checks and their tables
+    #
+    def Print(self):
+
+        for check in self.checks:
+            _state = {True: "OK", False: "FAILED", None: "INFO"}[check["passed"]]
+
+            print(f"\n--- {check['check'].upper()} ---")
+            print(f"{_state}: {check['value']} ({check['seconds'] * 1000:.2f} ms)")
+
+            if check["check"] in self.details:
+                print(self.details[check["check"]])
+
+        print("\nDATA VALIDATION PASSED" if self.passed else f"\nDATA VALIDATION FAILED: {self.Failures()}")
+
+
+def _plain(value):
+
+    return value.item() if hasattr(value, "item") else value